@@ -0,0 +1,37 @@
+"""
+Boid flocking simulation.
+
+The flock model (``flock``, ``spatial``, ``obstacles``, ``headless``, ``analytics``,
+``ensemble``, ``recording``, ``checkpoint``) needs only NumPy; pygame is imported by
+the frontend modules (``simulation``, ``render``, ``boid``, ``atlas``, ``hud``,
+``replay``) alone, so library and analysis code starts without it.
+"""
+
+import importlib
+import os
+
+# Keep pygame's import banner out of the output of the frontend, too
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Public names, imported on first access
+_EXPORTS = {
+    "FlockEngine": "flock",
+    "FlockSnapshot": "flock",
+    "HeadlessSimulation": "headless",
+    "FlockAnalytics": "analytics",
+    "Ensemble": "ensemble",
+    "TrajectoryRecorder": "recording",
+    "TrajectoryReader": "recording",
+    "save_checkpoint": "checkpoint",
+    "load_checkpoint": "checkpoint",
+    "Simulation": "simulation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
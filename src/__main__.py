@@ -0,0 +1,138 @@
+"""
+Command line entry point: ``python -m src [--headless] ...``.
+"""
+
+import argparse
+from . import config
+
+# Only config is imported up front, so --help and argument errors return without
+# loading NumPy; the modules a run needs are imported once the mode is known.
+
+def _setting(text: str) -> str:
+    name, sep, value = text.partition("=")
+    try:
+        if not sep:
+            raise ValueError("expected NAME=VALUE")
+        config.override(name.strip().upper(), value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{text}: {e}") from None
+    return text
+
+def _obstacle(text: str) -> tuple:
+    from .obstacles import parse_obstacle
+
+    return parse_obstacle(text)
+
+def parse_args(argv=None) -> argparse.Namespace:
+    # Apply --set first, so the defaults below reflect it
+    pre = argparse.ArgumentParser(prog="python -m src", add_help=False)
+    pre.add_argument("--set", type=_setting, action="append")
+    pre.parse_known_args(argv)
+
+    parser = argparse.ArgumentParser(prog="python -m src", description="Boid flocking simulation.")
+    parser.add_argument("--set", type=_setting, action="append", metavar="NAME=VALUE",
+                        help="Override any config constant, e.g. --set TURN_RATE=120 (repeatable; "
+                             "BOIDS_<NAME> environment variables work too).")
+    parser.add_argument("--headless", action="store_true", default=config.HEADLESS,
+                        help="Run without a window for a fixed number of ticks.")
+    parser.add_argument("--ticks", type=int, default=config.HEADLESS_TICKS,
+                        help="Ticks to run in headless mode.")
+    parser.add_argument("--width", type=int, default=config.WIDTH, help="World width.")
+    parser.add_argument("--height", type=int, default=config.HEIGHT, help="World height.")
+    parser.add_argument("--boids", type=int,
+                        help="Initial number of boids (default: INITIAL_BOIDS, or HEADLESS_BOIDS when headless).")
+    parser.add_argument("--headings", choices=("uniform", "aligned", "radial"), default=config.INITIAL_HEADINGS,
+                        help="Heading distribution of the initial boids.")
+    parser.add_argument("--obstacle", type=_obstacle, action="append", metavar="SHAPE:VALUES",
+                        help="Add an obstacle, circle:x,y,radius or rect:x,y,width,height (repeatable).")
+    parser.add_argument("--renderer", choices=("sprites", "pixels", "heatmap", "auto"), default=config.RENDERER,
+                        help="Draw boids as sprites, pixels or a density heatmap, or pick by on-screen density.")
+    parser.add_argument("--threaded", action="store_true", default=config.THREADED,
+                        help="Step the flock on a background thread, decoupled from rendering.")
+    parser.add_argument("--sim-rate", type=float, default=config.SIM_RATE,
+                        help="Steps per second of the background thread (default: real time, 0 as fast as possible).")
+    parser.add_argument("--seed", type=int, default=config.SEED,
+                        help="Seed for spawns, the same seed gives identical trajectories.")
+    parser.add_argument("--workers", type=int, default=config.WORKERS,
+                        help="Processes stepping a headless flock (1 in-process, 0 one per CPU).")
+    parser.add_argument("--record", metavar="PATH", default=config.RECORD_PATH,
+                        help="Record the trajectories to a binary file.")
+    parser.add_argument("--record-every", type=int, default=config.RECORD_EVERY, metavar="N",
+                        help="Record every N-th tick only.")
+    parser.add_argument("--replay", metavar="PATH", help="Play back a recording instead of simulating.")
+    parser.add_argument("--speed", type=float, default=config.REPLAY_SPEED,
+                        help="Replay speed relative to the recorded simulated time.")
+    parser.add_argument("--resume", metavar="PATH", default=config.RESUME_PATH,
+                        help="Start from a checkpoint instead of spawning new boids.")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="Checkpoint file written after a headless run (F5/F9 save/load it in the window).")
+    parser.add_argument("--analytics", metavar="PATH", default=config.ANALYTICS_PATH,
+                        help="Write flock metrics (polarization, clusters, neighbor distances) to a CSV file.")
+    parser.add_argument("--analytics-every", type=int, default=config.ANALYTICS_EVERY, metavar="N",
+                        help="Sample the flock metrics every N-th step.")
+    parser.add_argument("--profile", action="store_true", default=config.PROFILE,
+                        help="Time each frame phase.")
+    parser.add_argument("--profile-csv", metavar="PATH",
+                        help="Write per-frame phase timings to a CSV file (implies --profile).")
+    args = parser.parse_args(argv)
+    if args.headless and args.analytics and args.workers != 1:
+        parser.error("--analytics needs the in-process step, it cannot be combined with --workers")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    config.INITIAL_HEADINGS = args.headings
+    config.RECORD_EVERY = args.record_every
+    config.ANALYTICS_EVERY = args.analytics_every
+    if args.obstacle:
+        config.OBSTACLES = tuple(args.obstacle)
+    if args.replay:
+        from .replay import ReplayViewer
+
+        ReplayViewer(args.replay, args.speed).run()
+        return
+
+    from .profiling import Profiler
+
+    profiler = Profiler(enabled=args.profile or args.profile_csv is not None)
+    if args.profile_csv:
+        profiler.open_csv(args.profile_csv)
+
+    if args.headless:
+        from .headless import HeadlessSimulation
+
+        num_boids = args.boids if args.boids is not None else config.HEADLESS_BOIDS
+        if args.resume:
+            num_boids = 0
+        sim = HeadlessSimulation(args.width, args.height, num_boids, profiler=profiler,
+                                 workers=args.workers, seed=args.seed, record=args.record,
+                                 analytics=args.analytics)
+        if args.resume:
+            sim.load_checkpoint(args.resume)
+        stats = sim.run(args.ticks)
+        if args.checkpoint:
+            sim.save_checkpoint(args.checkpoint)
+        sim.close()
+        profiler.close_csv()
+        print(f"{stats['ticks']} ticks, {stats['boids']} boids in {stats['seconds']:.2f}s "
+              f"({stats['steps_per_sec']:.1f} steps/sec)")
+        return
+
+    # Only the windowed frontend needs pygame
+    config.WIDTH, config.HEIGHT = args.width, args.height
+    config.SEED = args.seed
+    config.RENDERER = args.renderer
+    config.RECORD_PATH = args.record
+    config.ANALYTICS_PATH = args.analytics
+    config.RESUME_PATH = args.resume
+    if args.checkpoint:
+        config.CHECKPOINT_PATH = args.checkpoint
+    config.THREADED, config.SIM_RATE = args.threaded, args.sim_rate
+    if args.boids is not None:
+        config.INITIAL_BOIDS = args.boids
+    from .simulation import Simulation
+
+    Simulation(profiler).run()
+
+if __name__ == "__main__":
+    main()
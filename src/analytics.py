@@ -0,0 +1,151 @@
+"""
+Streaming flock analytics, computed during the run from the neighbor data of the step.
+"""
+
+import csv
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+import numpy as np
+from . import config
+
+
+def connected_components(n: int, nbr_idx: np.ndarray) -> np.ndarray:
+    """
+    Label the connected components of the neighbor graph with a vectorized union-find.
+
+    Every edge hooks the larger of its two roots onto the smaller one, then paths are
+    compressed by pointer jumping, until no edge joins two different roots.
+
+    Args:
+        n (int): Number of boids.
+        nbr_idx (np.ndarray): (N, k) neighbor indices, -1 for none.
+
+    Returns:
+        np.ndarray: Component label of each boid, the smallest index in its component.
+    """
+    parent = np.arange(n)
+    valid = nbr_idx >= 0
+    src = np.broadcast_to(np.arange(n)[:, None], nbr_idx.shape)[valid]
+    dst = nbr_idx[valid]
+    while True:
+        ri, rj = parent[src], parent[dst]
+        joined = ri != rj
+        if not joined.any():
+            return parent
+        src, dst = src[joined], dst[joined]
+        ri, rj = ri[joined], rj[joined]
+        # Union: hook the larger root onto the smaller one
+        np.minimum.at(parent, np.maximum(ri, rj), np.minimum(ri, rj))
+        # Find: pointer jumping until every boid points at its root
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+
+class FlockAnalytics:
+    """
+    Flock metrics sampled every ``interval`` steps.
+
+    Each sample holds the polarization (length of the mean heading vector), the
+    cluster count and size distribution (union-find over the neighbor graph), the
+    mean nearest-neighbor distance and the fraction of boids touching the edge
+    margin. Samples go to a ring buffer of the last ``window`` ones and, if a CSV
+    file is open, are appended to it. Nearest-neighbor distances are also summed
+    into a histogram over the whole run.
+    """
+
+    def __init__(self, interval: int = config.ANALYTICS_EVERY, window: int = config.ANALYTICS_WINDOW,
+                 size_bins: int = config.ANALYTICS_SIZE_BINS, nn_bins: int = config.ANALYTICS_NN_BINS):
+        """
+        Initialize empty statistics.
+
+        Args:
+            interval (int): Sample every n-th step.
+            window (int): Samples kept in the ring buffer.
+            size_bins (int): Cluster size bins; bin i counts clusters of 2**i to 2**(i+1) - 1
+                boids, the last one everything larger.
+            nn_bins (int): Bins of the nearest-neighbor distance histogram over the perception radius.
+        """
+        self.interval = max(interval, 1)
+        self.size_bins = size_bins
+        self.samples: Deque[Dict[str, float]] = deque(maxlen=window)
+        self.nn_edges = np.linspace(0.0, config.BOID_SIZE * 12, nn_bins + 1)
+        self.nn_counts = np.zeros(nn_bins, dtype=np.int64)
+        self.columns: Tuple[str, ...] = (
+            "tick", "boids", "polarization", "clusters", "largest_cluster", "mean_cluster_size",
+            "mean_nn_dist", "edge_fraction") + tuple(f"clusters_{2 ** i}" for i in range(size_bins))
+        self._csv_file = None
+        self._csv_writer = None
+
+    @property
+    def latest(self) -> Optional[Dict[str, float]]:
+        """The most recent sample, None before the first one."""
+        return self.samples[-1] if self.samples else None
+
+    def update(self, tick: int, x: np.ndarray, y: np.ndarray, angle: np.ndarray,
+               nbr_idx: np.ndarray, nbr_dist: np.ndarray, width: float, height: float, wrap: bool = False):
+        """
+        Take a sample if the tick is due, from the state and neighbors of one step.
+
+        Args:
+            tick (int): Step number.
+            x (np.ndarray): X positions.
+            y (np.ndarray): Y positions.
+            angle (np.ndarray): Headings in degrees.
+            nbr_idx (np.ndarray): (N, k) neighbor indices the step found, -1 for none.
+            nbr_dist (np.ndarray): (N, k) neighbor distances, inf for none.
+            width (float): World width.
+            height (float): World height.
+            wrap (bool): Whether the world wraps around, so there are no edges.
+        """
+        if tick % self.interval:
+            return
+        n = len(x)
+        rad = np.deg2rad(angle)
+        polarization = float(np.hypot(np.cos(rad).mean(), np.sin(rad).mean())) if n else 0.0
+
+        labels = connected_components(n, nbr_idx)
+        sizes = np.bincount(labels, minlength=n)
+        sizes = sizes[sizes > 0]
+        size_bin = np.minimum(np.log2(np.maximum(sizes, 1)).astype(np.intp), self.size_bins - 1)
+        size_hist = np.bincount(size_bin, minlength=self.size_bins)
+
+        nearest = nbr_dist[:, 0] if nbr_dist.shape[1] else np.empty(0)
+        nearest = nearest[np.isfinite(nearest)]
+        self.nn_counts += np.histogram(nearest, bins=self.nn_edges)[0]
+
+        if wrap or n == 0:
+            edge_fraction = 0.0
+        else:
+            edge_dist = np.minimum(np.minimum(x, y), np.minimum(width - x, height - y))
+            edge_fraction = float((edge_dist < config.MARGIN).mean())
+
+        sample = {
+            "tick": tick,
+            "boids": n,
+            "polarization": polarization,
+            "clusters": len(sizes),
+            "largest_cluster": int(sizes.max()) if len(sizes) else 0,
+            "mean_cluster_size": float(sizes.mean()) if len(sizes) else 0.0,
+            "mean_nn_dist": float(nearest.mean()) if len(nearest) else float("nan"),
+            "edge_fraction": edge_fraction,
+        }
+        sample.update({f"clusters_{2 ** i}": int(c) for i, c in enumerate(size_hist)})
+        self.samples.append(sample)
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(sample)
+
+    def open_csv(self, path: str):
+        """Start appending samples to a CSV file."""
+        self.close_csv()
+        self._csv_file = open(path, "w", newline="")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.columns)
+        self._csv_writer.writeheader()
+
+    def close_csv(self):
+        """Flush and close the CSV file, if any."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = self._csv_writer = None
@@ -0,0 +1,74 @@
+import pygame as pg
+from typing import Dict, List, Tuple
+from . import config
+
+# Boid outline, pointing up, on a 15x15 surface
+BOID_SHAPE = ((7, 0), (12, 5), (3, 14), (11, 14), (2, 5), (7, 0))
+
+
+class RotationAtlas:
+    """
+    Pre-rendered rotations of one boid colour at evenly spaced headings.
+
+    Looking a sprite up by heading replaces a ``pg.transform.rotate`` (and a new
+    Surface allocation) per boid per frame.
+    """
+
+    def __init__(self, color: Tuple[int, int, int], steps: int = config.ROTATION_STEPS):
+        """
+        Render all headings of one colour.
+
+        Args:
+            color (Tuple[int, int, int]): Body color.
+            steps (int): Number of quantized headings over 360 degrees.
+        """
+        self.color = color
+        self.steps = steps
+        self.step = 360.0 / steps
+
+        image = pg.Surface((15, 15))
+        image.set_colorkey(config.BLACK)
+        pg.draw.polygon(image, color, BOID_SHAPE)
+        # Heading 0 points along +x
+        base = pg.transform.rotate(image, -90)
+
+        # Converted surfaces blit faster, but need a display mode to convert to
+        convert = pg.display.get_init() and pg.display.get_surface() is not None
+        self.frames: List[pg.Surface] = []
+        for i in range(steps):
+            frame = pg.transform.rotate(base, -i * self.step)
+            self.frames.append(frame.convert() if convert else frame)
+
+    def index(self, angle: float) -> int:
+        """Returns the frame index closest to the given heading in degrees."""
+        return round(angle / self.step) % self.steps
+
+    def get(self, angle: float) -> pg.Surface:
+        """Returns the pre-rendered sprite closest to the given heading in degrees."""
+        return self.frames[self.index(angle)]
+
+
+_atlases: Dict[Tuple[int, int], RotationAtlas] = {}
+
+
+def get_atlas(color_index: int, steps: int = config.ROTATION_STEPS) -> RotationAtlas:
+    """
+    Returns the shared atlas for a palette colour, rendering it on first use.
+
+    Args:
+        color_index (int): Index into config.PALETTE.
+        steps (int): Number of quantized headings.
+
+    Returns:
+        RotationAtlas: The atlas shared by all boids of that colour.
+    """
+    key = (color_index, steps)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = RotationAtlas(config.PALETTE[color_index], steps)
+    return atlas
+
+
+def clear_cache():
+    """Drops all atlases, e.g. after the display mode changed."""
+    _atlases.clear()
@@ -0,0 +1,221 @@
+"""
+Benchmark harness: steps/sec and per-phase frame time versus flock size.
+
+Run ``python -m src.benchmark --out results.json`` and later
+``python -m src.benchmark --compare results.json`` to catch regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from . import config
+from .flock import FlockEngine
+
+DEFAULT_SIZES = (100, 500, 2000, 10000, 20000)
+# Flock size whose density (in a config.WIDTH x config.HEIGHT world) is kept across sizes
+REFERENCE_BOIDS = 500
+PHASES = ("neighbors", "steering", "render")
+
+
+def world_size(num_boids: int, fixed: bool = False) -> tuple:
+    """
+    World dimensions for a flock size.
+
+    By default the world grows with the flock so density stays at that of
+    REFERENCE_BOIDS boids in a config.WIDTH x config.HEIGHT window.
+    """
+    if fixed:
+        return config.WIDTH, config.HEIGHT
+    scale = max(1.0, np.sqrt(num_boids / REFERENCE_BOIDS))
+    return int(config.WIDTH * scale), int(config.HEIGHT * scale)
+
+
+def make_flock(num_boids: int, width: int, height: int, seed: int = 0) -> FlockEngine:
+    """Returns a flock with boids at seeded random positions and headings."""
+    rng = np.random.default_rng(seed)
+    flock = FlockEngine(num_boids)
+    xs = rng.uniform(0, width, num_boids)
+    ys = rng.uniform(0, height, num_boids)
+    angles = rng.uniform(0, 360, num_boids)
+    colors = rng.integers(0, len(config.PALETTE), num_boids)
+    flock.add_boids(xs, ys, angles, color=colors)
+    return flock
+
+
+def make_renderer(flock: FlockEngine, width: int, height: int, backend: str = "sprites") -> Callable[[], None]:
+    """Returns a callable drawing the flock off-screen with the given renderer backend."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame as pg
+    from . import render
+
+    pg.init()
+    screen = pg.display.set_mode((width, height))
+    renderer = render.make_renderer(backend, flock)
+
+    def draw():
+        renderer.update(flock.snapshot())
+        screen.fill(config.BACKGROUND_COLOR)
+        renderer.draw(screen)
+
+    return draw
+
+
+def run_case(num_boids: int, wrap: bool, steps: int = 50, warmup: int = 5,
+             render: Optional[str] = None, fixed_world: bool = False, seed: int = 0) -> Dict:
+    """
+    Benchmark one flock size and edge mode.
+
+    Args:
+        num_boids (int): Flock size.
+        wrap (bool): Whether edges wrap around.
+        steps (int): Timed steps.
+        warmup (int): Untimed steps before measuring.
+        render (Optional[str]): Renderer backend to also time ("sprites", "pixels", "heatmap", "auto"; needs pygame).
+        fixed_world (bool): Keep the configured window size instead of scaling it.
+        seed (int): Seed for the initial positions.
+
+    Returns:
+        Dict: Steps/sec, step latency percentiles, per-phase mean milliseconds and peak memory.
+    """
+    dt = config.FIXED_DT
+    width, height = world_size(num_boids, fixed_world)
+    flock = make_flock(num_boids, width, height, seed)
+    renderer = make_renderer(flock, width, height, render) if render else None
+
+    def step(timings: Optional[Dict[str, List[float]]] = None):
+        t0 = time.perf_counter()
+        nbr_idx, nbr_dist = flock.find_neighbors(width, height, wrap)
+        t1 = time.perf_counter()
+        flock.apply(nbr_idx, nbr_dist, dt, width, height, wrap)
+        t2 = time.perf_counter()
+        if renderer is not None:
+            renderer()
+        t3 = time.perf_counter()
+        if timings is not None:
+            timings["neighbors"].append(t1 - t0)
+            timings["steering"].append(t2 - t1)
+            timings["render"].append(t3 - t2)
+            timings["total"].append(t3 - t0)
+
+    for _ in range(warmup):
+        step()
+
+    timings: Dict[str, List[float]] = {name: [] for name in PHASES + ("total",)}
+    for _ in range(steps):
+        step(timings)
+
+    # Measure memory separately, tracemalloc slows down allocation heavy code
+    tracemalloc.start()
+    for _ in range(min(steps, 3)):
+        step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = np.array(timings["total"])
+    return {
+        "boids": num_boids,
+        "wrap": wrap,
+        "world": [width, height],
+        "steps": steps,
+        "steps_per_sec": steps / total.sum(),
+        "step_ms_p50": float(np.percentile(total, 50) * 1000),
+        "step_ms_p99": float(np.percentile(total, 99) * 1000),
+        "phase_ms": {name: float(np.mean(timings[name]) * 1000) for name in PHASES},
+        "peak_mem_bytes": peak,
+    }
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = 0.1) -> List[str]:
+    """
+    Compare two benchmark reports.
+
+    Args:
+        baseline (Dict): Earlier report.
+        current (Dict): New report.
+        tolerance (float): Allowed relative slowdown in steps/sec.
+
+    Returns:
+        List[str]: One line per case slower than the tolerance allows.
+    """
+    old = {(r["boids"], r["wrap"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        ref = old.get((result["boids"], result["wrap"]))
+        if ref is None:
+            continue
+        ratio = result["steps_per_sec"] / ref["steps_per_sec"]
+        if ratio < 1.0 - tolerance:
+            regressions.append(f"{result['boids']} boids, wrap={result['wrap']}: "
+                               f"{ref['steps_per_sec']:.1f} -> {result['steps_per_sec']:.1f} steps/sec "
+                               f"({(1 - ratio) * 100:.0f}% slower)")
+    return regressions
+
+
+def run(sizes=DEFAULT_SIZES, wrap_modes=(False, True), **kwargs) -> Dict:
+    """Runs every (size, edge mode) case and returns the JSON-ready report."""
+    results = []
+    for num_boids in sizes:
+        for wrap in wrap_modes:
+            result = run_case(num_boids, wrap, **kwargs)
+            print(f"{num_boids:>7} boids wrap={str(wrap):<5} {result['steps_per_sec']:8.1f} steps/sec "
+                  f"p50 {result['step_ms_p50']:7.2f} ms  p99 {result['step_ms_p99']:7.2f} ms",
+                  file=sys.stderr)
+            results.append(result)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "neighbor_search": config.NEIGHBOR_SEARCH,
+            "neighbor_skin": config.NEIGHBOR_SKIN,
+            "render": kwargs.get("render"),
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Flock sizes to run.")
+    parser.add_argument("--wrap", choices=("both", "on", "off"), default="both", help="Edge modes to run.")
+    parser.add_argument("--steps", type=int, default=50, help="Timed steps per case.")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed steps per case.")
+    parser.add_argument("--render", nargs="?", const="sprites", choices=("sprites", "pixels", "heatmap", "auto"),
+                        help="Also time rendering with this backend, sprites if none is given (needs pygame).")
+    parser.add_argument("--fixed-world", action="store_true", help="Do not scale the world with flock size.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative slowdown.")
+    args = parser.parse_args(argv)
+
+    wrap_modes = {"both": (False, True), "on": (True,), "off": (False,)}[args.wrap]
+    report = run(args.sizes, wrap_modes, steps=args.steps, warmup=args.warmup,
+                 render=args.render, fixed_world=args.fixed_world, seed=args.seed)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.tolerance)
+        for line in regressions:
+            print("REGRESSION " + line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
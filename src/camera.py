@@ -0,0 +1,86 @@
+"""
+2D camera: pan and zoom over the world, with viewport culling of the flock.
+"""
+
+import numpy as np
+from typing import Tuple
+from . import config
+from .flock import FlockSnapshot
+
+class Camera:
+    """
+    Maps world coordinates to screen pixels.
+
+    The world point ``(x, y)`` is drawn at the top-left corner of the screen and
+    one world unit covers ``zoom`` pixels. Zoom never goes below 1, so the view
+    always lies inside a world the size of the screen.
+    """
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, zoom: float = 1.0):
+        """
+        Initialize the camera.
+
+        Args:
+            x (float): World x at the left screen edge.
+            y (float): World y at the top screen edge.
+            zoom (float): Screen pixels per world unit.
+        """
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+
+    def to_world(self, sx: float, sy: float) -> Tuple[float, float]:
+        """Returns the world position under a screen pixel."""
+        return self.x + sx / self.zoom, self.y + sy / self.zoom
+
+    def zoom_at(self, sx: float, sy: float, factor: float, width: float, height: float):
+        """
+        Zoom by a factor, keeping the world point under a screen pixel in place.
+
+        Args:
+            sx (float): Screen x of the zoom centre.
+            sy (float): Screen y of the zoom centre.
+            factor (float): Zoom multiplier, above 1 zooms in.
+            width (float): World (and screen) width.
+            height (float): World (and screen) height.
+        """
+        wx, wy = self.to_world(sx, sy)
+        self.zoom = min(max(self.zoom * factor, 1.0), config.MAX_ZOOM)
+        self.x = wx - sx / self.zoom
+        self.y = wy - sy / self.zoom
+        self.clamp(width, height)
+
+    def pan(self, dx: float, dy: float, width: float, height: float):
+        """Move the view by (dx, dy) screen pixels."""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp(width, height)
+
+    def clamp(self, width: float, height: float):
+        """Keep the view inside a world of the given size."""
+        self.x = min(max(self.x, 0.0), width - width / self.zoom)
+        self.y = min(max(self.y, 0.0), height - height / self.zoom)
+
+    def view(self, snapshot: FlockSnapshot, width: int, height: int,
+             margin: float = config.BOID_SIZE) -> FlockSnapshot:
+        """
+        Project a snapshot to screen pixels, dropping boids outside the viewport.
+
+        Args:
+            snapshot (FlockSnapshot): World-space flock state.
+            width (int): Screen width.
+            height (int): Screen height.
+            margin (float): Screen pixels beyond the edges still kept, so sprites straddling an edge show.
+
+        Returns:
+            FlockSnapshot: Screen-space state of the visible boids only.
+        """
+        if self.zoom == 1.0 and self.x == 0.0 and self.y == 0.0:
+            # Identity view, the snapshot is already in screen pixels
+            return snapshot
+        sx = (snapshot.x - self.x) * self.zoom
+        sy = (snapshot.y - self.y) * self.zoom
+        visible = np.flatnonzero((sx >= -margin) & (sx < width + margin)
+                                 & (sy >= -margin) & (sy < height + margin))
+        return FlockSnapshot(sx[visible], sy[visible], snapshot.angle[visible],
+                             snapshot.color[visible], snapshot.tick)
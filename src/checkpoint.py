@@ -0,0 +1,84 @@
+"""
+Checkpoints: save and restore the complete simulation state in one uncompressed ``.npz``.
+
+A checkpoint holds the front and back state buffers (x, y, angle, speed rows),
+the boid colours, the tick, the world size, the spawn generator's state, the
+obstacles and the config values the step depends on, so a restored run continues bit-identically.
+"""
+
+import json
+from typing import Dict, Optional, Tuple
+import numpy as np
+from . import config
+from .flock import FlockEngine
+from .obstacles import make_obstacle
+
+VERSION = 1
+# Config values that change how the flock steps
+CHECKPOINT_CONFIG = ("BOID_SIZE", "BOID_SPEED", "TURN_RATE", "MARGIN", "NEIGHBOR_COUNT",
+                     "NEIGHBOR_SEARCH", "NEIGHBOR_SKIN", "WRAP_EDGES", "FIXED_DT", "PALETTE",
+                     "FIELD_CELL", "EDGE_TURN_RATE")
+
+
+def save_checkpoint(path: str, flock: FlockEngine, width: float, height: float):
+    """
+    Write the flock and the relevant config to a checkpoint file.
+
+    Args:
+        path (str): File to write, used as given (no ``.npz`` is appended).
+        flock (FlockEngine): The flock to save.
+        width (float): World width.
+        height (float): World height.
+    """
+    n = flock.count
+    meta = {
+        "version": VERSION,
+        "tick": flock.tick,
+        "width": width,
+        "height": height,
+        "world": flock.world,
+        "rng": flock.rng.bit_generator.state,
+        "obstacles": [obstacle.spec() for obstacle in flock.obstacles],
+        "config": {name: getattr(config, name) for name in CHECKPOINT_CONFIG},
+    }
+    with open(path, "wb") as f:
+        np.savez(f, state=flock.state[:, :n], previous=flock.previous[:, :n],
+                 colors=flock.color, meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8))
+
+
+def load_checkpoint(path: str, flock: Optional[FlockEngine] = None,
+                    apply_config: bool = True) -> Tuple[FlockEngine, Dict]:
+    """
+    Restore a checkpoint.
+
+    Args:
+        path (str): File written by save_checkpoint.
+        flock (Optional[FlockEngine]): Flock to restore into (e.g. a ParallelFlockEngine),
+            a new FlockEngine if None.
+        apply_config (bool): Set the saved config values, so the run continues identically.
+
+    Returns:
+        Tuple[FlockEngine, Dict]: The restored flock and the checkpoint metadata
+        (tick, width, height, config).
+    """
+    with np.load(path) as data:
+        meta = json.loads(data["meta"].tobytes())
+        if meta.get("version") != VERSION:
+            raise ValueError(f"Unsupported checkpoint version {meta.get('version')} in {path}")
+        if apply_config:
+            for name, value in meta["config"].items():
+                if name == "PALETTE":
+                    value = tuple(tuple(color) for color in value)
+                setattr(config, name, value)
+
+        state = data["state"]
+        if flock is None:
+            flock = FlockEngine(max(state.shape[1], config.INITIAL_CAPACITY),
+                                neighbor_search=config.NEIGHBOR_SEARCH, skin=config.NEIGHBOR_SKIN)
+        elif apply_config:
+            flock.neighbor_search, flock.skin = config.NEIGHBOR_SEARCH, config.NEIGHBOR_SKIN
+        world = tuple(meta["world"]) if meta["world"] is not None else None
+        flock.restore(state, data["previous"], data["colors"], meta["tick"], world)
+        flock.set_obstacles([make_obstacle(spec) for spec in meta.get("obstacles", ())])
+    flock.rng.bit_generator.state = meta["rng"]
+    return flock, meta
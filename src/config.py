@@ -1,8 +1,18 @@
 """
 Configuration settings for the Boid simulation.
+
+Any constant can be overridden without editing this file: from the environment as
+``BOIDS_<NAME>=value`` (applied when this module is first imported, so spawned worker
+processes inherit it too) or from the command line as ``--set NAME=value``.
+Many constants are default arguments of the model's classes and functions, bound
+when those modules are imported, so overrides made in code (``config.NAME = value``
+or ``override``) must come before importing them, or pass the values explicitly.
 """
 
-from typing import Tuple
+import ast
+import os
+import warnings
+from typing import Any, Dict, Optional, Tuple, Union, get_args, get_origin
 
 # Window settings
 FULLSCREEN: bool = True
@@ -20,8 +30,140 @@ BOID_SIZE: int = 17
 BOID_SPEED: float = 170.0
 TURN_RATE: float = 190.0
 MARGIN: int = 42
+NEIGHBOR_COUNT: int = 7
+NEIGHBOR_SEARCH: str = "grid"  # "grid" (cell list) or "brute" (all pairs)
+NEIGHBOR_SKIN: float = 0.0  # Verlet list skin in pixels, 0 disables list reuse
 WRAP_EDGES: bool = False
+# Obstacles as ("circle", x, y, radius) or ("rect", x, y, width, height), avoided within MARGIN
+OBSTACLES: Tuple[Tuple, ...] = ()
+FIELD_CELL: float = 4.0  # Obstacle distance field grid spacing in pixels
+# Turn rate at a wall or obstacle surface, blended with TURN_RATE across MARGIN; None keeps TURN_RATE
+EDGE_TURN_RATE: Optional[float] = None
+HEADING_SPREAD: float = 15.0  # Std. deviation (degrees) of "aligned" bulk spawns
+
+# Rendering settings
+ROTATION_STEPS: int = 72  # Pre-rendered headings per boid colour
+RENDERER: str = "auto"  # "sprites", "pixels" (NumPy scatter into the screen), "heatmap" or "auto" (level of detail)
+SPRITE_RENDER_LIMIT: int = 2000  # "auto" draws more visible boids than this as pixels
+HEATMAP_DENSITY: float = 0.05  # "auto" draws a heatmap above this many visible boids per screen pixel
+PIXEL_GLYPH_LENGTH: int = 4  # Pixels per boid in the pixel renderer, drawn back along the heading
+HEATMAP_CELL: int = 8  # Heatmap cell size in screen pixels
+HEATMAP_COLOR: Tuple[int, int, int] = (255, 200, 80)  # Colour of the densest heatmap cell
+OBSTACLE_COLOR: Tuple[int, int, int] = (70, 70, 90)
+MAX_ZOOM: float = 16.0
+ZOOM_STEP: float = 1.25  # Zoom factor per mouse wheel notch
+PAN_SPEED: float = 600.0  # Screen pixels per second while an arrow key is held
+# Boid colours, each gets one shared rotation atlas
+PALETTE: Tuple[Tuple[int, int, int], ...] = (
+    (255, 99, 71), (255, 165, 0), (255, 215, 0), (173, 255, 47),
+    (60, 179, 113), (64, 224, 208), (100, 149, 237), (123, 104, 238),
+    (218, 112, 214), (255, 105, 180), (240, 230, 140), (245, 245, 245),
+)
 
 # Simulation settings
-MAX_BOIDS: int = 500
+INITIAL_CAPACITY: int = 512  # Flock storage grows by doubling past this
+INITIAL_BOIDS: int = 1  # Boids spawned when the window opens
+INITIAL_HEADINGS: str = "uniform"  # "uniform", "aligned" or "radial"
 FPS: int = 60
+FIXED_DT: float = 1.0 / 60  # Simulated seconds per step, independent of the frame rate
+MAX_STEPS_PER_FRAME: int = 5  # Drop simulated time rather than fall further behind
+THREADED: bool = False  # Step the flock on a background thread, decoupled from rendering
+SIM_RATE: Optional[float] = None  # Steps per second of the background thread, None for 1 / FIXED_DT (real time), 0 for as fast as possible
+SEED: Optional[int] = None  # Seed for spawn positions, headings and colours
+HEADLESS: bool = False  # Step the flock without a window or frame-rate cap
+HEADLESS_TICKS: int = 1000
+HEADLESS_BOIDS: int = 500
+WORKERS: int = 1  # Processes stepping a headless flock, 1 steps in-process, 0 uses every CPU
+ENSEMBLE_BOIDS: int = 200  # Boids per run of a parameter sweep
+ENSEMBLE_CHUNK: int = 16  # Sweep runs stacked into one batched ensemble step
+
+# Recording settings
+RECORD_PATH: Optional[str] = None  # Record the windowed run's trajectories to this file
+RECORD_EVERY: int = 1  # Record every n-th tick
+RECORD_QUEUE: int = 256  # Steps buffered for the recording writer thread before the step loop waits
+REPLAY_SPEED: float = 1.0  # Replay speed relative to the recorded simulated time
+
+# Checkpoint settings
+CHECKPOINT_PATH: str = "checkpoint.npz"  # Saved with F5 and loaded with F9 in the window
+RESUME_PATH: Optional[str] = None  # Checkpoint to start from instead of spawning INITIAL_BOIDS
+
+# Analytics settings
+ANALYTICS_PATH: Optional[str] = None  # CSV file for flock metrics, None disables them
+ANALYTICS_EVERY: int = 10  # Sample the metrics every n-th step
+ANALYTICS_WINDOW: int = 600  # Samples kept in memory
+ANALYTICS_SIZE_BINS: int = 10  # Power-of-two cluster size bins
+ANALYTICS_NN_BINS: int = 32  # Nearest-neighbor distance histogram bins
+
+# Profiling settings
+PROFILE: bool = False  # Time each frame phase (always on while the HUD is shown)
+PROFILE_WINDOW: int = 120  # Frames kept for rolling statistics
+HUD_KEY: str = "f3"  # Toggles the performance overlay
+
+# Environment variables named ENV_PREFIX + <NAME> override <NAME> at import
+ENV_PREFIX: str = "BOIDS_"
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+def parse_value(name: str, text: str) -> Any:
+    """
+    Convert text to a value of the setting's declared type.
+
+    Args:
+        name (str): Setting name, e.g. "TURN_RATE".
+        text (str): The value as typed, e.g. "120", "true", "(255, 0, 0)" or "none".
+
+    Returns:
+        Any: The parsed value.
+
+    Raises:
+        ValueError: If there is no such setting or the text does not fit its type.
+    """
+    kind = __annotations__.get(name)
+    if kind is None or name == "ENV_PREFIX":
+        raise ValueError(f"Unknown setting {name}")
+    text = text.strip()
+    if get_origin(kind) is Union and type(None) in get_args(kind):
+        # Optional[...] settings also take "none"
+        if text.lower() in ("", "none"):
+            return None
+        kind = next(arg for arg in get_args(kind) if arg is not type(None))
+    if kind is bool:
+        if text.lower() not in _TRUE + _FALSE:
+            raise ValueError(f"{name} expects a boolean, got {text!r}")
+        return text.lower() in _TRUE
+    if kind in (int, float, str):
+        try:
+            return kind(text)
+        except ValueError:
+            raise ValueError(f"{name} expects {kind.__name__}, got {text!r}") from None
+    try:
+        value = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        value = None
+    if not isinstance(value, tuple):
+        raise ValueError(f"{name} expects a tuple literal, got {text!r}")
+    return value
+
+
+def override(name: str, text: str):
+    """Set a setting from text, see parse_value."""
+    globals()[name] = parse_value(name, text)
+
+
+def update(settings: Dict[str, Any]):
+    """Set several settings to values, e.g. the parent's in a worker process."""
+    globals().update(settings)
+
+
+def _apply_env(environ=os.environ):
+    # Warn rather than raise, other tools may use the prefix too and the package must stay importable
+    for key, text in environ.items():
+        if key.startswith(ENV_PREFIX):
+            try:
+                override(key[len(ENV_PREFIX):], text)
+            except ValueError as e:
+                warnings.warn(f"Ignoring {key}: {e}")
+
+
+_apply_env()
@@ -0,0 +1,259 @@
+"""
+Ensemble runner: parameter sweeps over the flocking constants.
+
+Many small, independent flocks with different constants are stacked along a run
+axis and stepped together by one vectorized kernel; chunks of runs are spread over
+a process pool and each run's summary metrics go to a CSV table.
+
+    python -m src.ensemble --param BOID_SIZE=12,17,22 --param TURN_RATE=120,190 --out sweep.csv
+"""
+
+import argparse
+import csv
+import itertools
+import multiprocessing as mp
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from . import config
+from .flock import ANGLE, SPEED, X, Y, steer
+from .spatial import CellList, select_nearest
+
+# Constants that may differ between the runs of an ensemble
+SWEEPABLE = ("BOID_SIZE", "TURN_RATE", "BOID_SPEED", "MARGIN")
+METRICS = ("polarization", "mean_polarization", "mean_nn_dist", "mean_neighbors", "edge_fraction")
+
+
+class Ensemble:
+    """
+    Independent flocks in bounded worlds of the same size, stepped in one batch.
+
+    ``state`` has shape (4, runs, boids): the flock rows of FlockEngine.state with an
+    extra run axis. A step flattens the run axis, offsets each run by twice the world
+    width so one cell list covers all of them, drops neighbor pairs across runs and
+    steers every boid at once with per-boid copies of its run's constants.
+    """
+
+    def __init__(self, params: Sequence[Dict[str, float]], num_boids: int, width: float, height: float,
+                 seeds: Optional[Sequence[int]] = None):
+        """
+        Spawn every run's flock.
+
+        Args:
+            params (Sequence[Dict[str, float]]): Constants of each run, missing ones come from config.
+            num_boids (int): Boids per run.
+            width (float): World width.
+            height (float): World height.
+            seeds (Optional[Sequence[int]]): Spawn seed of each run, the run index if None.
+        """
+        unknown = {name for run in params for name in run} - set(SWEEPABLE)
+        if unknown:
+            raise ValueError(f"Cannot sweep {', '.join(sorted(unknown))}, only {', '.join(SWEEPABLE)}")
+        self.params = [dict(run) for run in params]
+        self.runs = len(params)
+        self.num_boids = num_boids
+        self.width = width
+        self.height = height
+        self.tick = 0
+        values = {name: np.array([run.get(name, getattr(config, name)) for run in params], dtype=float)
+                  for name in SWEEPABLE}
+        self.size, self.turn_rate, self.margin = values["BOID_SIZE"], values["TURN_RATE"], values["MARGIN"]
+
+        self.state = np.zeros((4, self.runs, num_boids))
+        seeds = range(self.runs) if seeds is None else seeds
+        for r, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            self.state[X, r] = rng.uniform(0, width, num_boids)
+            self.state[Y, r] = rng.uniform(0, height, num_boids)
+            self.state[ANGLE, r] = rng.uniform(0, 360, num_boids)
+        self.state[SPEED] = values["BOID_SPEED"][:, None]
+
+        # Flat run index of every boid and the run constants repeated per boid
+        self.run_of = np.repeat(np.arange(self.runs), num_boids)
+        self._offset = self.run_of * 2.0 * width
+        self._size = self.size[self.run_of]
+        self._turn_rate = self.turn_rate[self.run_of]
+        self._margin = self.margin[self.run_of]
+        radius = self.size * 12
+        self._radius_sq = (radius ** 2)[self.run_of]
+        self.cells = CellList(radius.max(), self.runs * 2.0 * width, height)
+
+        # Running sums for the summary metrics
+        self._polarization = np.zeros(self.runs)
+        self._nn_dist = np.zeros(self.runs)
+        self._nn_count = np.zeros(self.runs)
+        self._neighbors = np.zeros(self.runs)
+        self._edge = np.zeros(self.runs)
+
+    def find_neighbors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (indices, distances) of every boid's nearest neighbors within its own run."""
+        x, y = self.state[X].ravel(), self.state[Y].ravel()
+        sx = x + self._offset
+        n = len(x)
+        self.cells.build(sx, y)
+        owner, cand, d2 = self.cells.pairs(sx, y, self.cells.cell_size, exclude=np.arange(n))
+        keep = (self.run_of[owner] == self.run_of[cand]) & (d2 < self._radius_sq[owner])
+        return select_nearest(owner[keep], cand[keep], d2[keep], n, config.NEIGHBOR_COUNT)
+
+    def step(self, dt: float = config.FIXED_DT):
+        """Advance every run by one step and update the running metrics."""
+        if self.num_boids == 0:
+            return
+        nbr_idx, nbr_dist = self.find_neighbors()
+        shape = (self.runs, self.num_boids)
+        x, y, angle, speed = (self.state[row].ravel() for row in (X, Y, ANGLE, SPEED))
+        new_x, new_y, new_angle = steer(x, y, angle, speed, nbr_idx, nbr_dist, dt,
+                                        self.width, self.height, size=self._size,
+                                        turn_rate=self._turn_rate, margin=self._margin)
+        self.state[X], self.state[Y], self.state[ANGLE] = (
+            new_x.reshape(shape), new_y.reshape(shape), new_angle.reshape(shape))
+        self.tick += 1
+
+        self._polarization += self.polarization()
+        nearest = nbr_dist[:, 0].reshape(shape)
+        found = np.isfinite(nearest)
+        self._nn_dist += np.where(found, nearest, 0.0).sum(axis=1)
+        self._nn_count += found.sum(axis=1)
+        self._neighbors += (nbr_idx >= 0).sum(axis=1).reshape(shape).mean(axis=1)
+        sx, sy = self.state[X], self.state[Y]
+        edge_dist = np.minimum(np.minimum(sx, sy), np.minimum(self.width - sx, self.height - sy))
+        self._edge += (edge_dist < self.margin[:, None]).mean(axis=1)
+
+    def polarization(self) -> np.ndarray:
+        """Returns each run's polarization: length of the mean heading vector, 1 when all align."""
+        rad = np.deg2rad(self.state[ANGLE])
+        return np.hypot(np.cos(rad).mean(axis=1), np.sin(rad).mean(axis=1))
+
+    def summary(self) -> List[Dict[str, float]]:
+        """Returns one row per run: its constants and metrics averaged over the steps so far."""
+        steps = max(self.tick, 1)
+        polarization = self.polarization()
+        rows = []
+        for r in range(self.runs):
+            row = {name: self.params[r].get(name, getattr(config, name)) for name in SWEEPABLE}
+            row.update({
+                "polarization": float(polarization[r]),
+                "mean_polarization": float(self._polarization[r] / steps),
+                "mean_nn_dist": float(self._nn_dist[r] / self._nn_count[r]) if self._nn_count[r] else float("nan"),
+                "mean_neighbors": float(self._neighbors[r] / steps),
+                "edge_fraction": float(self._edge[r] / steps),
+            })
+            rows.append(row)
+        return rows
+
+
+def parameter_grid(values: Dict[str, Sequence[float]], repeats: int = 1) -> List[Dict[str, float]]:
+    """
+    Returns every combination of the given values, each repeated ``repeats`` times.
+
+    Args:
+        values (Dict[str, Sequence[float]]): Values to sweep per constant.
+        repeats (int): Runs per combination, with different spawn seeds.
+
+    Returns:
+        List[Dict[str, float]]: Parameter sets, each with a "repeat" entry.
+    """
+    names = list(values)
+    grid = []
+    for combo in itertools.product(*(values[name] for name in names)):
+        for repeat in range(repeats):
+            params = dict(zip(names, combo))
+            params["repeat"] = repeat
+            grid.append(params)
+    return grid
+
+
+def _run_chunk(task: tuple) -> List[Dict[str, float]]:
+    """Run one chunk of the sweep in a worker process."""
+    params, num_boids, width, height, steps, dt, seed = task
+    runs = [{name: value for name, value in p.items() if name != "repeat"} for p in params]
+    # Same seed for every combination of a repeat, so the runs differ only by their constants
+    ensemble = Ensemble(runs, num_boids, width, height, seeds=[seed + p["repeat"] for p in params])
+    for _ in range(steps):
+        ensemble.step(dt)
+    rows = ensemble.summary()
+    for row, p in zip(rows, params):
+        row["repeat"] = p["repeat"]
+    return rows
+
+
+def run_sweep(grid: Sequence[Dict[str, float]], num_boids: int = config.ENSEMBLE_BOIDS,
+              width: float = config.WIDTH, height: float = config.HEIGHT, steps: int = config.HEADLESS_TICKS,
+              dt: float = config.FIXED_DT, workers: int = 1, chunk: int = config.ENSEMBLE_CHUNK,
+              seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Run every parameter set of a sweep and return their summary rows in order.
+
+    Args:
+        grid (Sequence[Dict[str, float]]): Parameter sets, see parameter_grid.
+        num_boids (int): Boids per run.
+        width (float): World width.
+        height (float): World height.
+        steps (int): Steps per run.
+        dt (float): Simulated seconds per step.
+        workers (int): Worker processes, 1 runs in-process, 0 uses every CPU.
+        chunk (int): Runs stacked into one Ensemble.
+        seed (int): Base spawn seed, repeat i uses seed + i.
+
+    Returns:
+        List[Dict[str, float]]: One row of constants and metrics per parameter set.
+    """
+    chunk = max(chunk, 1)
+    tasks = [(list(grid[i:i + chunk]), num_boids, width, height, steps, dt, seed)
+             for i in range(0, len(grid), chunk)]
+    if workers == 1:
+        results = [_run_chunk(task) for task in tasks]
+    else:
+        # Unswept constants come from config, forward it so spawned workers match the parent
+        settings = {name: getattr(config, name) for name in SWEEPABLE + ("NEIGHBOR_COUNT",)}
+        with mp.Pool(workers or mp.cpu_count(), initializer=config.update, initargs=(settings,)) as pool:
+            results = pool.map(_run_chunk, tasks)
+    return [row for rows in results for row in rows]
+
+
+def write_table(rows: Sequence[Dict[str, float]], f):
+    """Write summary rows as CSV."""
+    writer = csv.DictWriter(f, fieldnames=list(SWEEPABLE) + ["repeat"] + list(METRICS))
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _parse_param(text: str) -> tuple:
+    name, _, values = text.partition("=")
+    name = name.strip().upper()
+    if name not in SWEEPABLE or not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=v1,v2,... with NAME one of {', '.join(SWEEPABLE)}")
+    return name, [float(v) for v in values.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.ensemble", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--param", type=_parse_param, action="append", default=[], metavar="NAME=v1,v2",
+                        help=f"Values to sweep, repeatable. One of {', '.join(SWEEPABLE)}.")
+    parser.add_argument("--repeats", type=int, default=1, help="Runs per combination, with different seeds.")
+    parser.add_argument("--boids", type=int, default=config.ENSEMBLE_BOIDS, help="Boids per run.")
+    parser.add_argument("--steps", type=int, default=config.HEADLESS_TICKS, help="Steps per run.")
+    parser.add_argument("--width", type=int, default=config.WIDTH, help="World width.")
+    parser.add_argument("--height", type=int, default=config.HEIGHT, help="World height.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (1 in-process, 0 one per CPU).")
+    parser.add_argument("--chunk", type=int, default=config.ENSEMBLE_CHUNK, help="Runs stepped together per task.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write the CSV table here instead of stdout.")
+    args = parser.parse_args(argv)
+
+    grid = parameter_grid(dict(args.param), args.repeats)
+    start = time.perf_counter()
+    rows = run_sweep(grid, args.boids, args.width, args.height, args.steps,
+                     workers=args.workers, chunk=args.chunk, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            write_table(rows, f)
+    else:
+        write_table(rows, sys.stdout)
+    print(f"{len(rows)} runs x {args.steps} steps in {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,591 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+from . import config
+from .obstacles import DistanceField, Obstacle, avoidance, build_field
+from .profiling import Profiler
+from .spatial import CellList, VerletList
+
+# Row indices into FlockEngine.state
+X, Y, ANGLE, SPEED = range(4)
+
+# Steering constant: a scalar for every boid, an array of per-boid values, or None for the config value
+Param = Union[float, np.ndarray, None]
+
+
+def nearest_neighbors(x: np.ndarray, y: np.ndarray, k: int, radius: float,
+                      period: Optional[Tuple[float, float]] = None,
+                      block: int = 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find up to k nearest other boids within radius, for every boid at once.
+
+    Brute-force reference implementation: distances are computed in row blocks
+    so memory stays at O(block * N) instead of O(N^2).
+
+    Args:
+        x (np.ndarray): X positions of all boids.
+        y (np.ndarray): Y positions of all boids.
+        k (int): Maximum number of neighbors per boid.
+        radius (float): Perception radius.
+        period (Optional[Tuple[float, float]]): World (width, height) if distances wrap around.
+        block (int): Number of query rows processed per batch.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (indices, distances), both of shape (N, k).
+        Missing neighbors are padded with index -1 and distance inf.
+    """
+    n = len(x)
+    idx = np.full((n, k), -1, dtype=np.intp)
+    dist = np.full((n, k), np.inf)
+    if n < 2 or k <= 0:
+        return idx, dist
+
+    kk = min(k, n - 1)
+    radius_sq = radius * radius
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        rows = np.arange(stop - start)
+        dx = x[start:stop, None] - x[None, :]
+        dy = y[start:stop, None] - y[None, :]
+        if period is not None:
+            dx -= period[0] * np.round(dx / period[0])
+            dy -= period[1] * np.round(dy / period[1])
+        d2 = dx * dx + dy * dy
+        # Exclude self
+        d2[rows, rows + start] = np.inf
+
+        # argpartition is O(N) per row, we only need the k smallest
+        if kk < n - 1:
+            cand = np.argpartition(d2, kk, axis=1)[:, :kk]
+        else:
+            cand = np.argsort(d2, axis=1)[:, :kk]
+        cand_d2 = np.take_along_axis(d2, cand, axis=1)
+
+        within = cand_d2 < radius_sq
+        idx[start:stop, :kk] = np.where(within, cand, -1)
+        dist[start:stop, :kk] = np.where(within, np.sqrt(cand_d2), np.inf)
+
+    return idx, dist
+
+
+def steer(x: np.ndarray, y: np.ndarray, angle: np.ndarray, speed: np.ndarray,
+          nbr_idx: np.ndarray, nbr_dist: np.ndarray, dt: float,
+          width: float, height: float, wrap: bool = False,
+          rows: Optional[np.ndarray] = None, size: Param = None,
+          turn_rate: Param = None, margin: Param = None,
+          field: Optional[DistanceField] = None
+          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Apply separation, alignment, cohesion, edge avoidance and crowd speed to every boid.
+
+    This is the batched equivalent of the old per-sprite ``Boid.update``.
+    All inputs are read-only, new arrays are returned.
+    With ``rows`` only those boids are steered; neighbor indices still refer to the full arrays.
+
+    Args:
+        x (np.ndarray): X positions.
+        y (np.ndarray): Y positions.
+        angle (np.ndarray): Headings in degrees.
+        speed (np.ndarray): Base speed of each boid.
+        nbr_idx (np.ndarray): (N, k) neighbor indices, -1 for none.
+        nbr_dist (np.ndarray): (N, k) neighbor distances, inf for none.
+        dt (float): Delta time in seconds.
+        width (float): World width.
+        height (float): World height.
+        wrap (bool): Whether to wrap around world edges.
+        rows (Optional[np.ndarray]): Indices of the boids to steer, all if None.
+        size (Param): Boid size, config.BOID_SIZE if None.
+        turn_rate (Param): Degrees turned per second, config.TURN_RATE if None.
+        margin (Param): Edge avoidance distance, config.MARGIN if None.
+            Each of the three may also be an array with one value per steered boid.
+        field (Optional[DistanceField]): Obstacles to avoid like the world edges, None for none.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: New (x, y, angle) of the steered boids.
+    """
+    # Neighbor lookups go through the full arrays, the rest only needs the steered rows
+    all_x, all_y, all_angle = x, y, angle
+    if rows is not None:
+        x, y, angle, speed = x[rows], y[rows], angle[rows], speed[rows]
+    n = len(x)
+    arange = np.arange(n)
+    size = config.BOID_SIZE if size is None else size
+    turn_rate = config.TURN_RATE if turn_rate is None else turn_rate
+    margin = config.MARGIN if margin is None else margin
+
+    valid = nbr_idx >= 0
+    n_neighbors = valid.sum(axis=1)
+    has_neighbors = n_neighbors > 0
+    safe_idx = np.where(valid, nbr_idx, 0)
+
+    # Alignment: average heading of neighbors
+    nbr_rad = np.deg2rad(all_angle[safe_idx])
+    target_sin = np.where(valid, np.sin(nbr_rad), 0.0).sum(axis=1)
+    target_cos = np.where(valid, np.cos(nbr_rad), 0.0).sum(axis=1)
+    avg_angle = np.rad2deg(np.arctan2(target_sin, target_cos))
+
+    # Cohesion: center of mass of neighbors, relative to each boid
+    rel_x = all_x[safe_idx] - x[:, None]
+    rel_y = all_y[safe_idx] - y[:, None]
+    if wrap:
+        # Neighbors across the seam are seen through the nearest image
+        rel_x -= width * np.round(rel_x / width)
+        rel_y -= height * np.round(rel_y / height)
+    nbr_x = x[:, None] + rel_x
+    nbr_y = y[:, None] + rel_y
+    denom = np.maximum(n_neighbors, 1)
+    target_x = np.where(valid, nbr_x, 0.0).sum(axis=1) / denom
+    target_y = np.where(valid, nbr_y, 0.0).sum(axis=1) / denom
+
+    # Separation: if too close, target the closest neighbor (and steer away below)
+    closest = np.argmin(nbr_dist, axis=1)
+    closest_dist = nbr_dist[arange, closest]
+    too_close = closest_dist < size
+    target_x = np.where(too_close, nbr_x[arange, closest], target_x)
+    target_y = np.where(too_close, nbr_y[arange, closest], target_y)
+
+    diff_x = target_x - x
+    diff_y = target_y - y
+    target_dist = np.hypot(diff_x, diff_y)
+    target_angle = np.rad2deg(np.arctan2(diff_y, diff_x))
+
+    # If close enough to neighbors generally, align with them
+    target_angle = np.where(target_dist < size * 6, avg_angle, target_angle)
+
+    # Normalize to -180 to 180
+    diff_angle = (target_angle - angle + 180) % 360 - 180
+    turn_dir = np.where(np.abs(target_angle - angle) > 1.2, diff_angle, 0.0)
+    turn_dir = np.where(too_close, -turn_dir, turn_dir)
+    turn_dir = np.where(has_neighbors, turn_dir, 0.0)
+
+    # Distance to, and turn away from, the nearest wall or obstacle
+    avoid_dist = np.full(n, np.inf)
+    avoid_turn = np.zeros(n)
+    if not wrap:
+        # Screen margin avoidance: turn toward the edge normal
+        avoid_dist = np.minimum(np.minimum(x, y), np.minimum(width - x, height - y))
+        target_a = np.where(x < margin, 0.0, np.where(x > width - margin, 180.0, 0.0))
+        target_a = np.where(y < margin, 90.0, np.where(y > height - margin, 270.0, target_a))
+        avoid_turn = (target_a - angle + 180) % 360 - 180
+    if field is not None:
+        # Obstacle avoidance: turn up the distance field gradient
+        obstacle_dist, obstacle_turn = avoidance(field, x, y, angle)
+        nearer = obstacle_dist < avoid_dist
+        avoid_dist = np.where(nearer, obstacle_dist, avoid_dist)
+        avoid_turn = np.where(nearer, obstacle_turn, avoid_turn)
+    turn_dir = np.where(avoid_dist < margin, avoid_turn, turn_dir)
+
+    if config.EDGE_TURN_RATE is not None:
+        # Blend from the normal turn rate at the margin to EDGE_TURN_RATE at the surface
+        closeness = np.clip(1.0 - avoid_dist / margin, 0.0, 1.0)
+        turn_rate = turn_rate + closeness * (config.EDGE_TURN_RATE - turn_rate)
+
+    new_angle = (angle + turn_rate * dt * np.sign(turn_dir)) % 360
+
+    # Speed modulation based on crowd
+    rad = np.deg2rad(new_angle)
+    actual_speed = speed + (config.NEIGHBOR_COUNT - n_neighbors) * 2
+    new_x = x + np.cos(rad) * dt * actual_speed
+    new_y = y + np.sin(rad) * dt * actual_speed
+
+    if wrap:
+        new_x = np.where(new_x < 0, width, np.where(new_x > width, 0.0, new_x))
+        new_y = np.where(new_y < 0, height, np.where(new_y > height, 0.0, new_y))
+
+    return new_x, new_y, new_angle
+
+
+@dataclass(frozen=True)
+class FlockSnapshot:
+    """Read-only copy of the flock state for rendering."""
+
+    x: np.ndarray
+    y: np.ndarray
+    angle: np.ndarray
+    color: np.ndarray
+    tick: int
+
+    @property
+    def count(self) -> int:
+        return len(self.x)
+
+
+class FlockEngine:
+    """
+    Whole-flock simulation state stored as structure-of-arrays.
+
+    Each row of ``state`` holds one attribute (x, y, angle, speed) for every boid,
+    so a frame is a handful of NumPy operations instead of one Python call per boid.
+    ``colors`` holds each boid's index into config.PALETTE.
+
+    Storage grows by doubling as boids are added, removal swaps the last boid into
+    the freed slot, and every step only touches the first ``count`` (active) columns.
+
+    The state is double-buffered: a step reads only the front buffer and writes the
+    back buffer, then the two are swapped. Every boid therefore sees the same frame
+    regardless of order, and ``previous`` keeps the last frame for render interpolation.
+    Random spawns draw from a seeded generator, so a seed gives identical trajectories.
+    """
+
+    def __init__(self, capacity: int = config.INITIAL_CAPACITY, neighbor_search: str = config.NEIGHBOR_SEARCH,
+                 skin: float = config.NEIGHBOR_SKIN, seed: Optional[int] = config.SEED):
+        """
+        Initialize an empty flock.
+
+        Args:
+            capacity (int): Initial storage capacity, grown automatically.
+            neighbor_search (str): "grid" for the cell-list index, "brute" for all-pairs search.
+            skin (float): Verlet skin for cached neighbor lists, 0 rebuilds every frame (grid only).
+            seed (Optional[int]): Seed for random spawns, None for a fresh one.
+        """
+        if neighbor_search not in ("grid", "brute"):
+            raise ValueError(f"Unknown neighbor search: {neighbor_search}")
+        self._buffers = self._allocate(max(capacity, 1))
+        self._front = 0
+        self.state = self._buffers[self._front]
+        self.rng = np.random.default_rng(seed)
+        self.tick = 0
+        # World size of the last step, used to spot wrap-around jumps when interpolating
+        self.world: Optional[Tuple[float, float]] = None
+        self.colors = np.zeros(max(capacity, 1), dtype=np.uint8)
+        self.count = 0
+        self.neighbor_search = neighbor_search
+        self.skin = skin
+        self.cells: Optional[CellList] = None
+        self.verlet: Optional[VerletList] = None
+        # Disabled unless the owner attaches an enabled one
+        self.profiler = Profiler()
+        # Optional FlockAnalytics fed with the neighbors of every step
+        self.analytics = None
+        self.obstacles: Tuple[Obstacle, ...] = ()
+        self.field: Optional[DistanceField] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.state.shape[1]
+
+    @property
+    def previous(self) -> np.ndarray:
+        """State before the last step (the back buffer)."""
+        return self._buffers[1 - self._front]
+
+    @property
+    def neighbor_rebuilds(self) -> int:
+        """Number of Verlet neighbor list rebuilds so far."""
+        return self.verlet.rebuilds if self.verlet is not None else 0
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.state[X, :self.count]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.state[Y, :self.count]
+
+    @property
+    def angle(self) -> np.ndarray:
+        return self.state[ANGLE, :self.count]
+
+    @property
+    def speed(self) -> np.ndarray:
+        return self.state[SPEED, :self.count]
+
+    @property
+    def color(self) -> np.ndarray:
+        return self.colors[:self.count]
+
+    def add_boid(self, x: float, y: float, angle: float, speed: float = config.BOID_SPEED,
+                 color: int = 0) -> int:
+        """
+        Append a boid to the flock.
+
+        Args:
+            x (float): X position.
+            y (float): Y position.
+            angle (float): Heading in degrees.
+            speed (float): Base speed.
+            color (int): Index into config.PALETTE.
+
+        Returns:
+            int: Index of the new boid.
+        """
+        return int(self.add_boids([x], [y], [angle], [speed], [color])[0])
+
+    def add_boids(self, x: np.ndarray, y: np.ndarray, angle: np.ndarray,
+                  speed: Optional[np.ndarray] = None, color: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Append many boids with one array copy per attribute.
+
+        Args:
+            x (np.ndarray): X positions.
+            y (np.ndarray): Y positions.
+            angle (np.ndarray): Headings in degrees.
+            speed (Optional[np.ndarray]): Base speeds, config.BOID_SPEED if not given.
+            color (Optional[np.ndarray]): Indices into config.PALETTE, 0 if not given.
+
+        Returns:
+            np.ndarray: Indices of the new boids.
+        """
+        n = len(x)
+        self.reserve(self.count + n)
+        new = slice(self.count, self.count + n)
+        for buffer in self._buffers:
+            buffer[X, new] = x
+            buffer[Y, new] = y
+            buffer[ANGLE, new] = angle
+            buffer[SPEED, new] = config.BOID_SPEED if speed is None else speed
+        self.colors[new] = 0 if color is None else color
+        self.count += n
+        if self.verlet is not None:
+            self.verlet.invalidate()
+        return np.arange(new.start, new.stop)
+
+    def _allocate(self, capacity: int) -> List[np.ndarray]:
+        """Returns zeroed front and back state buffers of the given capacity."""
+        return [np.zeros((4, capacity), dtype=float) for _ in range(2)]
+
+    def reserve(self, capacity: int):
+        """
+        Make room for at least ``capacity`` boids, at least doubling the storage when it grows.
+
+        Args:
+            capacity (int): Number of boids that must fit.
+        """
+        if capacity <= self.capacity:
+            return
+        capacity = max(capacity, 2 * self.capacity)
+        n = self.count
+        buffers = self._allocate(capacity)
+        for new, old in zip(buffers, self._buffers):
+            new[:, :n] = old[:, :n]
+        self._buffers = buffers
+        self.state = buffers[self._front]
+
+        colors = np.zeros(capacity, dtype=np.uint8)
+        colors[:n] = self.colors[:n]
+        self.colors = colors
+
+    def remove(self, index: int) -> int:
+        """
+        Remove a boid by moving the last boid into its slot.
+
+        Args:
+            index (int): Index of the boid to remove.
+
+        Returns:
+            int: Previous index of the boid now stored at ``index``, or -1 if the removed boid was last.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"No boid at index {index}")
+        last = self.count - 1
+        if index != last:
+            for buffer in self._buffers:
+                buffer[:, index] = buffer[:, last]
+            self.colors[index] = self.colors[last]
+        self.count -= 1
+        if self.verlet is not None:
+            self.verlet.invalidate()
+        return last if index != last else -1
+
+    def restore(self, front: np.ndarray, previous: np.ndarray, colors: np.ndarray, tick: int,
+                world: Optional[Tuple[float, float]] = None):
+        """
+        Replace the whole flock, e.g. from a checkpoint.
+
+        Args:
+            front (np.ndarray): (4, N) current state rows.
+            previous (np.ndarray): (4, N) state before the last step, for interpolation.
+            colors (np.ndarray): Palette index of each boid.
+            tick (int): Steps taken so far.
+            world (Optional[Tuple[float, float]]): World size of the last step.
+        """
+        n = front.shape[1]
+        self.count = 0
+        self.reserve(n)
+        self._front = 0
+        self._buffers[0][:, :n] = front
+        self._buffers[1][:, :n] = previous
+        self.state = self._buffers[0]
+        self.colors[:n] = colors
+        self.count = n
+        self.tick = tick
+        self.world = world
+        if self.verlet is not None:
+            self.verlet.invalidate()
+
+    def set_obstacles(self, obstacles: Sequence[Obstacle]):
+        """Replace the obstacles, the distance field is rasterized again on the next step."""
+        self.obstacles = tuple(obstacles)
+        self.field = None
+
+    def nearest(self, x: float, y: float) -> int:
+        """Returns the index of the boid closest to a point, or -1 if the flock is empty."""
+        if self.count == 0:
+            return -1
+        return int(np.argmin((self.x - x) ** 2 + (self.y - y) ** 2))
+
+    def spawn(self, width: float, height: float, x: Optional[float] = None,
+              y: Optional[float] = None) -> int:
+        """
+        Add a boid with a random heading and colour from the flock's generator.
+
+        Args:
+            width (float): World width, for a random position.
+            height (float): World height, for a random position.
+            x (Optional[float]): X position, random if not given.
+            y (Optional[float]): Y position, random if not given.
+
+        Returns:
+            int: Index of the new boid.
+        """
+        if x is None or y is None:
+            x, y = self.rng.uniform(0, width), self.rng.uniform(0, height)
+        angle = self.rng.uniform(0, 360)
+        color = int(self.rng.integers(len(config.PALETTE)))
+        return self.add_boid(float(x), float(y), float(angle), color=color)
+
+    def spawn_boids(self, n: int, width: float, height: float,
+                    region: Optional[Tuple[float, float, float, float]] = None,
+                    heading_distribution: str = "uniform") -> np.ndarray:
+        """
+        Add n boids at random positions in one vectorized batch.
+
+        Args:
+            n (int): Number of boids.
+            width (float): World width.
+            height (float): World height.
+            region (Optional[Tuple[float, float, float, float]]): (x, y, w, h) spawn area, the whole world if None.
+            heading_distribution (str): "uniform" for random headings, "aligned" for one shared
+                heading with config.HEADING_SPREAD degrees of noise, "radial" for pointing away
+                from the region centre.
+
+        Returns:
+            np.ndarray: Indices of the new boids.
+        """
+        rx, ry, rw, rh = region if region is not None else (0.0, 0.0, width, height)
+        x = rx + self.rng.uniform(0, rw, n)
+        y = ry + self.rng.uniform(0, rh, n)
+
+        if heading_distribution == "uniform":
+            angle = self.rng.uniform(0, 360, n)
+        elif heading_distribution == "aligned":
+            angle = (self.rng.uniform(0, 360) + self.rng.normal(0, config.HEADING_SPREAD, n)) % 360
+        elif heading_distribution == "radial":
+            angle = np.rad2deg(np.arctan2(y - (ry + rh / 2), x - (rx + rw / 2))) % 360
+        else:
+            raise ValueError(f"Unknown heading distribution: {heading_distribution}")
+
+        color = self.rng.integers(len(config.PALETTE), size=n)
+        return self.add_boids(x, y, angle, color=color)
+
+    def find_neighbors(self, width: float, height: float, wrap: bool = False
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest neighbors within the perception radius of every boid.
+
+        Args:
+            width (float): World width.
+            height (float): World height.
+            wrap (bool): Whether distances wrap around world edges.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (indices, distances) of shape (N, NEIGHBOR_COUNT).
+        """
+        radius = config.BOID_SIZE * 12
+        x, y = self.x, self.y
+        if self.neighbor_search == "brute":
+            period = (width, height) if wrap else None
+            return nearest_neighbors(x, y, config.NEIGHBOR_COUNT, radius, period)
+
+        if self.skin > 0:
+            verlet = self.verlet
+            if (verlet is None or verlet.radius != radius or verlet.skin != self.skin
+                    or verlet.periodic != wrap or (verlet.width, verlet.height) != (width, height)):
+                verlet = self.verlet = VerletList(radius, self.skin, width, height, periodic=wrap)
+            return verlet.query(x, y, config.NEIGHBOR_COUNT)
+
+        cells = self.cells
+        if (cells is None or cells.cell_size != radius or cells.periodic != wrap
+                or (cells.width, cells.height) != (width, height)):
+            cells = self.cells = CellList(radius, width, height, periodic=wrap)
+        cells.build(x, y)
+        return cells.query(x, y, config.NEIGHBOR_COUNT, radius, exclude=np.arange(self.count))
+
+    def apply(self, nbr_idx: np.ndarray, nbr_dist: np.ndarray, dt: float,
+              width: float, height: float, wrap: bool = False):
+        """
+        Steer and move every boid given its neighbors, updating the state in place.
+
+        Args:
+            nbr_idx (np.ndarray): (N, k) neighbor indices from find_neighbors.
+            nbr_dist (np.ndarray): (N, k) neighbor distances from find_neighbors.
+            dt (float): Delta time since last frame.
+            width (float): World width.
+            height (float): World height.
+            wrap (bool): Whether to wrap around world edges.
+        """
+        back = self._buffers[1 - self._front]
+        self.field = build_field(self.obstacles, width, height, self.field)
+        back[X, :self.count], back[Y, :self.count], back[ANGLE, :self.count] = steer(
+            self.x, self.y, self.angle, self.speed, nbr_idx, nbr_dist, dt, width, height, wrap,
+            field=self.field)
+        self._swap(width, height)
+
+    def _swap(self, width: float, height: float):
+        """Make the freshly written back buffer the front one."""
+        self._front = 1 - self._front
+        self.state = self._buffers[self._front]
+        self.world = (width, height)
+        self.tick += 1
+
+    def snapshot(self, alpha: float = 1.0) -> FlockSnapshot:
+        """
+        Returns a read-only copy of the state, interpolated between the last two steps.
+
+        Args:
+            alpha (float): 0 for the previous step, 1 for the current one.
+
+        Returns:
+            FlockSnapshot: Positions, headings and colours for rendering.
+        """
+        n = self.count
+        x, y, angle = self.state[X, :n], self.state[Y, :n], self.state[ANGLE, :n]
+        if alpha < 1.0 and self.world is not None:
+            prev = self.previous
+            dx = x - prev[X, :n]
+            dy = y - prev[Y, :n]
+            # Boids that wrapped around jump straight to their new position
+            jumped = (np.abs(dx) > self.world[0] / 2) | (np.abs(dy) > self.world[1] / 2)
+            t = np.where(jumped, 1.0, alpha)
+            x = prev[X, :n] + dx * t
+            y = prev[Y, :n] + dy * t
+            turn = (angle - prev[ANGLE, :n] + 180) % 360 - 180
+            angle = (prev[ANGLE, :n] + turn * t) % 360
+        else:
+            x, y, angle = x.copy(), y.copy(), angle.copy()
+        color = self.colors[:n].copy()
+        for array in (x, y, angle, color):
+            array.flags.writeable = False
+        return FlockSnapshot(x, y, angle, color, self.tick)
+
+    def step(self, dt: float, width: float, height: float, wrap: bool = False):
+        """
+        Advance every boid by one frame.
+
+        Args:
+            dt (float): Delta time since last frame.
+            width (float): World width.
+            height (float): World height.
+            wrap (bool): Whether to wrap around world edges.
+        """
+        if self.count == 0:
+            return
+        with self.profiler.phase("neighbors"):
+            nbr_idx, nbr_dist = self.find_neighbors(width, height, wrap)
+        if self.analytics is not None:
+            # Reuses this step's neighbors, sampled on the state they were found for
+            with self.profiler.phase("analytics"):
+                self.analytics.update(self.tick, self.x, self.y, self.angle, nbr_idx, nbr_dist,
+                                      width, height, wrap)
+        with self.profiler.phase("steering"):
+            self.apply(nbr_idx, nbr_dist, dt, width, height, wrap)
@@ -0,0 +1,129 @@
+"""
+Headless simulation: steps the flock without pygame, a display or a frame-rate cap.
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+from . import config
+from .analytics import FlockAnalytics
+from .checkpoint import load_checkpoint, save_checkpoint
+from .flock import FlockEngine
+from .obstacles import make_obstacle
+from .profiling import Profiler
+from .recording import TrajectoryRecorder
+
+class HeadlessSimulation:
+    """
+    Runs the flock model for a fixed number of ticks as fast as the CPU allows.
+
+    Only the NumPy flock engine is used, so this works on machines without a display.
+    """
+
+    def __init__(self, width: int = config.WIDTH, height: int = config.HEIGHT,
+                 num_boids: int = config.HEADLESS_BOIDS, profiler: Optional[Profiler] = None,
+                 workers: int = config.WORKERS, seed: Optional[int] = config.SEED,
+                 record: Optional[str] = None, analytics: Optional[str] = None):
+        """
+        Initialize the world and spawn boids at random positions.
+
+        Args:
+            width (int): World width.
+            height (int): World height.
+            num_boids (int): Number of boids to spawn.
+            profiler (Optional[Profiler]): Phase timers for the flock step.
+            workers (int): Processes stepping the flock, 1 steps in-process, 0 uses every CPU.
+            seed (Optional[int]): Seed for spawns; the same seed gives identical trajectories.
+            record (Optional[str]): File to record the trajectories to, see TrajectoryRecorder.
+            analytics (Optional[str]): CSV file for flock metrics, see FlockAnalytics; only with workers=1.
+        """
+        if analytics and workers != 1:
+            raise ValueError("Flock analytics need the in-process step, use workers=1")
+        self.width = width
+        self.height = height
+        capacity = max(num_boids, config.INITIAL_CAPACITY)
+        if workers == 1:
+            self.flock = FlockEngine(capacity, seed=seed)
+        else:
+            from .parallel import ParallelFlockEngine
+
+            self.flock = ParallelFlockEngine(capacity, workers, seed=seed)
+        self.flock.set_obstacles([make_obstacle(spec) for spec in config.OBSTACLES])
+        self.profiler = profiler if profiler is not None else Profiler(enabled=config.PROFILE)
+        self.flock.profiler = self.profiler
+        self.ticks = 0
+        if analytics:
+            self.flock.analytics = FlockAnalytics(config.ANALYTICS_EVERY)
+            self.flock.analytics.open_csv(analytics)
+        # Created by the first step, so a loaded checkpoint's world, step and config are recorded
+        self.record = record
+        self.recorder: Optional[TrajectoryRecorder] = None
+        self.add_boids(num_boids, heading_distribution=config.INITIAL_HEADINGS)
+
+    def add_boid(self):
+        """Adds a boid at a random position and heading."""
+        self.flock.spawn(self.width, self.height)
+
+    def add_boids(self, n: int, region: Optional[Tuple[float, float, float, float]] = None,
+                  heading_distribution: str = "uniform"):
+        """
+        Adds n boids in one batch.
+
+        Args:
+            n (int): Number of boids.
+            region (Optional[Tuple[float, float, float, float]]): (x, y, w, h) spawn area, the whole world if None.
+            heading_distribution (str): "uniform", "aligned" or "radial", see FlockEngine.spawn_boids.
+        """
+        self.flock.spawn_boids(n, self.width, self.height, region, heading_distribution)
+
+    def save_checkpoint(self, path: str):
+        """Write the full simulation state to a checkpoint file."""
+        save_checkpoint(path, self.flock, self.width, self.height)
+
+    def load_checkpoint(self, path: str):
+        """Replace the flock, world size and config with those of a checkpoint."""
+        _, meta = load_checkpoint(path, self.flock)
+        self.width, self.height = meta["width"], meta["height"]
+
+    def step(self, dt: Optional[float] = None):
+        """Advance the flock by one tick of dt seconds, config.FIXED_DT if None."""
+        dt = dt if dt is not None else config.FIXED_DT
+        if self.record and self.recorder is None:
+            self.recorder = TrajectoryRecorder(self.record, self.width, self.height, dt, decimate=config.RECORD_EVERY)
+        self.flock.step(dt, self.width, self.height, wrap=config.WRAP_EDGES)
+        if self.recorder is not None:
+            self.recorder.record(self.flock)
+        self.profiler.end_frame()
+        self.ticks += 1
+
+    def close(self):
+        """Finish recording and analytics, release worker processes and shared memory of a parallel flock."""
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.flock.analytics is not None:
+            self.flock.analytics.close_csv()
+        close = getattr(self.flock, "close", None)
+        if close is not None:
+            close()
+
+    def run(self, ticks: int, dt: Optional[float] = None) -> Dict[str, float]:
+        """
+        Step the flock for a fixed number of ticks.
+
+        Args:
+            ticks (int): Number of ticks to run.
+            dt (Optional[float]): Simulated seconds per tick, config.FIXED_DT (read each tick,
+                so a loaded checkpoint's value applies) if None.
+
+        Returns:
+            Dict[str, float]: Ticks run, wall-clock seconds and steps per second.
+        """
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step(dt)
+        elapsed = time.perf_counter() - start
+        return {
+            "ticks": ticks,
+            "boids": self.flock.count,
+            "seconds": elapsed,
+            "steps_per_sec": ticks / elapsed if elapsed > 0 else float("inf"),
+        }
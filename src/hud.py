@@ -0,0 +1,49 @@
+import pygame as pg
+from typing import List, Optional
+from . import config
+from .profiling import Profiler
+
+class PerformanceHud:
+    """
+    On-screen overlay with FPS, boid count and per-phase milliseconds.
+    """
+
+    def __init__(self, profiler: Profiler):
+        """
+        Initialize the overlay.
+
+        Args:
+            profiler (Profiler): Source of the per-phase timings.
+        """
+        self.profiler = profiler
+        self.font = pg.font.Font(None, 20)
+        self.line_height = self.font.get_linesize()
+
+    def lines(self, fps: float, num_boids: int, sim_rate: Optional[float] = None) -> List[str]:
+        """Returns the text lines of the overlay."""
+        lines = [f"FPS {fps:6.1f}", f"Boids {num_boids}"]
+        if sim_rate is not None:
+            lines.append(f"Steps/s {sim_rate:6.1f}")
+        for name in self.profiler.phases:
+            lines.append(f"{name:<10}{self.profiler.mean_ms(name):7.2f} ms"
+                         f"  p99 {self.profiler.percentile_ms(name, 99):6.2f}")
+        return lines
+
+    def draw(self, screen: pg.Surface, fps: float, num_boids: int, sim_rate: Optional[float] = None):
+        """
+        Draw the overlay in the top-left corner.
+
+        Args:
+            screen (pg.Surface): Surface to draw on.
+            fps (float): Current frames per second.
+            num_boids (int): Number of boids in the flock.
+            sim_rate (Optional[float]): Steps per second of a background stepping thread.
+        """
+        lines = self.lines(fps, num_boids, sim_rate)
+        rendered = [self.font.render(line, True, config.WHITE) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        panel = pg.Surface((width, self.line_height * len(rendered) + 8), pg.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (6, 4 + i * self.line_height))
+        screen.blit(panel, (8, 8))
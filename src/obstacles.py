@@ -0,0 +1,169 @@
+"""
+Obstacles and the precomputed signed distance field boids steer around.
+"""
+
+import numpy as np
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+from . import config
+
+
+class Circle(NamedTuple):
+    """Round obstacle, e.g. a rock."""
+
+    x: float
+    y: float
+    radius: float
+
+    def distance(self, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        """Signed distance from points to the circle, negative inside."""
+        return np.hypot(px - self.x, py - self.y) - self.radius
+
+    def spec(self) -> Tuple:
+        return ("circle",) + tuple(self)
+
+
+class Rect(NamedTuple):
+    """Axis-aligned box obstacle, e.g. a wall."""
+
+    x: float
+    y: float
+    width: float
+    height: float
+
+    def distance(self, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        """Signed distance from points to the box, negative inside."""
+        dx = np.abs(px - (self.x + self.width / 2)) - self.width / 2
+        dy = np.abs(py - (self.y + self.height / 2)) - self.height / 2
+        outside = np.hypot(np.maximum(dx, 0.0), np.maximum(dy, 0.0))
+        return outside + np.minimum(np.maximum(dx, dy), 0.0)
+
+    def spec(self) -> Tuple:
+        return ("rect",) + tuple(self)
+
+
+Obstacle = Union[Circle, Rect]
+_SHAPES = {"circle": Circle, "rect": Rect}
+
+
+def make_obstacle(spec: Sequence) -> Obstacle:
+    """
+    Returns an obstacle from its spec, as used in config.OBSTACLES.
+
+    Args:
+        spec (Sequence): ("circle", x, y, radius) or ("rect", x, y, width, height).
+
+    Returns:
+        Obstacle: The shape.
+    """
+    kind, *values = spec
+    shape = _SHAPES.get(kind)
+    if shape is None or len(values) != len(shape._fields):
+        raise ValueError(f"Invalid obstacle: {spec}")
+    return shape(*(float(v) for v in values))
+
+
+class DistanceField:
+    """
+    Signed distance to the nearest obstacle (and world border), sampled on a grid.
+
+    The field and its gradient are rasterized once when the obstacles or the world
+    change, at a cost of O(cells * obstacles). Steering then needs one grid lookup per
+    boid instead of a test of every boid against every obstacle.
+    """
+
+    def __init__(self, width: float, height: float, obstacles: Sequence[Obstacle] = (),
+                 border: bool = True, cell: Optional[float] = None):
+        """
+        Rasterize the field.
+
+        Args:
+            width (float): World width.
+            height (float): World height.
+            obstacles (Sequence[Obstacle]): Shapes to avoid.
+            border (bool): Whether the world edges are walls too (False for wrapped worlds).
+            cell (Optional[float]): Grid spacing in pixels, config.FIELD_CELL if None.
+        """
+        cell = cell if cell is not None else config.FIELD_CELL
+        self.width = width
+        self.height = height
+        self.obstacles = tuple(obstacles)
+        self.border = border
+        self.cell = cell
+        self.nx = max(1, int(np.ceil(width / cell)))
+        self.ny = max(1, int(np.ceil(height / cell)))
+
+        # Sample at cell centres, indexed [column, row]
+        px, py = np.meshgrid((np.arange(self.nx) + 0.5) * cell, (np.arange(self.ny) + 0.5) * cell, indexing="ij")
+        distance = np.full(px.shape, np.inf)
+        if border:
+            distance = np.minimum(np.minimum(px, py), np.minimum(width - px, height - py))
+        for obstacle in self.obstacles:
+            distance = np.minimum(distance, obstacle.distance(px, py))
+        self.distance = distance
+        if self.nx > 1 and self.ny > 1 and np.isfinite(distance).all():
+            self.grad_x, self.grad_y = np.gradient(distance, cell)
+        else:
+            self.grad_x = self.grad_y = np.zeros_like(distance)
+
+    def lookup(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample the field at every position.
+
+        Args:
+            x (np.ndarray): X positions.
+            y (np.ndarray): Y positions.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (distance, gradient x, gradient y);
+            the gradient points away from the nearest obstacle.
+        """
+        ix = np.clip((x // self.cell).astype(np.intp), 0, self.nx - 1)
+        iy = np.clip((y // self.cell).astype(np.intp), 0, self.ny - 1)
+        return self.distance[ix, iy], self.grad_x[ix, iy], self.grad_y[ix, iy]
+
+
+def avoidance(field: DistanceField, x: np.ndarray, y: np.ndarray,
+              angle: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distance to the nearest obstacle and the turn toward free space.
+
+    Args:
+        field (DistanceField): Obstacle field.
+        x (np.ndarray): X positions.
+        y (np.ndarray): Y positions.
+        angle (np.ndarray): Headings in degrees.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (distance, turn): signed distance to the nearest
+        obstacle and signed degrees from each heading to the gradient heading.
+    """
+    distance, gx, gy = field.lookup(x, y)
+    target = np.rad2deg(np.arctan2(gy, gx))
+    return distance, (target - angle + 180) % 360 - 180
+
+
+def parse_obstacle(text: str) -> Tuple:
+    """Returns the spec of a CLI obstacle like ``circle:300,200,50`` or ``rect:0,0,40,800``."""
+    kind, _, values = text.partition(":")
+    spec = (kind.strip().lower(),) + tuple(float(v) for v in values.split(",") if v.strip())
+    make_obstacle(spec)
+    return spec
+
+
+def build_field(obstacles: Sequence[Obstacle], width: float, height: float,
+                field: Optional[DistanceField] = None) -> Optional[DistanceField]:
+    """
+    Returns a field for the obstacles at config.FIELD_CELL spacing, reusing ``field``
+    if it already matches; None without obstacles.
+
+    The world border is left out, steer avoids it with its edge rule whether or not
+    there are obstacles.
+    """
+    if not obstacles:
+        return None
+    obstacles = tuple(obstacles)
+    cell = config.FIELD_CELL
+    if (field is not None and field.obstacles == obstacles and not field.border
+            and (field.width, field.height, field.cell) == (width, height, cell)):
+        return field
+    return DistanceField(width, height, obstacles, border=False, cell=cell)
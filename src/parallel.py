@@ -0,0 +1,210 @@
+"""
+Multi-core flock stepping over shared memory.
+
+The flock state lives in two ``multiprocessing.shared_memory`` blocks (front and
+back) with the same (x, y, angle, speed) rows as FlockEngine.state. Each worker
+owns a vertical strip of the world, steers the boids inside it against the
+read-only front buffer and writes them into the back buffer; the main process
+then swaps the buffers.
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import numpy as np
+from . import config
+from .flock import ANGLE, SPEED, X, Y, FlockEngine, steer
+from .obstacles import DistanceField, build_field
+from .spatial import CellList
+
+# Config values the worker kernels read, sent with every task so workers match the parent
+# even after it changes them (e.g. by loading a checkpoint)
+WORKER_CONFIG = ("BOID_SIZE", "TURN_RATE", "MARGIN", "NEIGHBOR_COUNT", "FIELD_CELL", "EDGE_TURN_RATE")
+
+# Per-worker attachment to the current shared buffers, refreshed when the flock grows
+_worker_names: Tuple[str, ...] = ()
+_worker_shm: List[shared_memory.SharedMemory] = []
+_worker_buffers: List[np.ndarray] = []
+# Per-worker obstacle field, rasterized again only when the obstacles or world change
+_worker_field: Optional[DistanceField] = None
+
+
+def _attach(names: Tuple[str, ...], capacity: int) -> List[np.ndarray]:
+    """Returns the shared state buffers, attaching them if they changed since the last task."""
+    global _worker_names
+    if names != _worker_names:
+        _worker_buffers.clear()
+        for shm in _worker_shm:
+            shm.close()
+        _worker_shm[:] = [shared_memory.SharedMemory(name=name) for name in names]
+        _worker_buffers[:] = [np.ndarray((4, capacity), dtype=float, buffer=shm.buf) for shm in _worker_shm]
+        _worker_names = names
+    return _worker_buffers
+
+
+def strip_members(x: np.ndarray, x0: float, strip_width: float, halo: float,
+                  width: float, periodic: bool, first: bool, last: bool
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split boids into those owned by a strip and those visible to it.
+
+    Args:
+        x (np.ndarray): X positions of all boids.
+        x0 (float): Left edge of the strip.
+        strip_width (float): Width of the strip.
+        halo (float): Extra distance on both sides whose boids can be neighbors.
+        width (float): World width.
+        periodic (bool): Whether the world wraps around.
+        first (bool): Whether this is the leftmost strip.
+        last (bool): Whether this is the rightmost strip.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (owned, visible) boolean masks; owned boids are also visible.
+    """
+    if periodic:
+        offset = (x - x0) % width
+        owned = offset < strip_width
+        visible = owned | (offset < strip_width + halo) | (offset >= width - halo)
+        return owned, visible
+
+    # Boids that left the world belong to the border strips
+    lo = -np.inf if first else x0
+    hi = np.inf if last else x0 + strip_width
+    owned = (x >= lo) & (x < hi)
+    visible = (x >= lo - halo) & (x < hi + halo)
+    return owned, visible
+
+
+def _step_strip(task: Tuple) -> None:
+    """Steer the boids of one strip from the front buffer into the back buffer."""
+    global _worker_field
+    names, capacity, front_id, strip, strips, count, dt, width, height, wrap, obstacles, settings = task
+    config.update(settings)
+    buffers = _attach(names, capacity)
+    _worker_field = build_field(obstacles, width, height, _worker_field)
+    front = buffers[front_id][:, :count]
+    back = buffers[1 - front_id]
+
+    radius = config.BOID_SIZE * 12
+    strip_width = width / strips
+    owned, visible = strip_members(front[X], strip * strip_width, strip_width, radius,
+                                   width, wrap, strip == 0, strip == strips - 1)
+    local = np.flatnonzero(visible)
+    if not owned.any():
+        return
+    rows = np.flatnonzero(owned[local])
+
+    x, y, angle, speed = front[X, local], front[Y, local], front[ANGLE, local], front[SPEED, local]
+    cells = CellList(radius, width, height, periodic=wrap)
+    cells.build(x, y)
+    nbr_idx, nbr_dist = cells.query(x[rows], y[rows], config.NEIGHBOR_COUNT, radius, exclude=rows)
+    new_x, new_y, new_angle = steer(x, y, angle, speed, nbr_idx, nbr_dist, dt, width, height, wrap, rows=rows,
+                                    field=_worker_field)
+
+    targets = local[rows]
+    back[X, targets] = new_x
+    back[Y, targets] = new_y
+    back[ANGLE, targets] = new_angle
+
+
+class ParallelFlockEngine(FlockEngine):
+    """
+    FlockEngine stepped by a process pool over shared-memory front/back buffers.
+
+    Neighbor search and steering both run inside the workers, so the profiler
+    only sees the whole parallel step as the "steering" phase, and analytics,
+    which need the step's neighbor lists, are not supported.
+    Call ``close`` (or use as a context manager) to stop the workers and free the memory.
+    """
+
+    def __init__(self, capacity: int = config.INITIAL_CAPACITY, workers: int = 0,
+                 strips: Optional[int] = None, seed: Optional[int] = config.SEED):
+        """
+        Initialize the shared buffers and start the workers.
+
+        Args:
+            capacity (int): Initial storage capacity, grown automatically.
+            workers (int): Number of worker processes, 0 for one per CPU.
+            strips (Optional[int]): Number of world strips, one per worker by default.
+            seed (Optional[int]): Seed for random spawns, None for a fresh one.
+        """
+        self._shm: List[shared_memory.SharedMemory] = []
+        self._retired: List[shared_memory.SharedMemory] = []
+        self._closed = False
+        super().__init__(capacity, seed=seed)
+        self.workers = workers or mp.cpu_count()
+        self.strips = strips or self.workers
+        self._pool = mp.Pool(self.workers)
+
+    def _allocate(self, capacity: int) -> List[np.ndarray]:
+        """Returns front and back buffers in fresh shared memory, releasing the old blocks."""
+        if self._closed:
+            return super()._allocate(capacity)
+        # reserve() copies from the old buffers after this returns, keep them mapped until then
+        self._retired = self._shm
+        nbytes = 4 * capacity * np.dtype(float).itemsize
+        self._shm = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)]
+        buffers = [np.ndarray((4, capacity), dtype=float, buffer=shm.buf) for shm in self._shm]
+        for buffer in buffers:
+            buffer[:] = 0.0
+        return buffers
+
+    def reserve(self, capacity: int):
+        super().reserve(capacity)
+        self._release(self._retired)
+        self._retired = []
+
+    @staticmethod
+    def _release(blocks: List[shared_memory.SharedMemory]):
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                # Someone still holds a view; the mapping goes away with it
+                pass
+            shm.unlink()
+
+    def step(self, dt: float, width: float, height: float, wrap: bool = False):
+        """
+        Advance every boid by one frame on the worker pool.
+
+        Args:
+            dt (float): Delta time since last frame.
+            width (float): World width.
+            height (float): World height.
+            wrap (bool): Whether to wrap around world edges.
+        """
+        if self._pool is None:
+            # Closed: fall back to stepping in-process
+            return super().step(dt, width, height, wrap)
+        if self.count == 0:
+            return
+        names = tuple(shm.name for shm in self._shm)
+        settings = {name: getattr(config, name) for name in WORKER_CONFIG}
+        tasks = [(names, self.capacity, self._front, strip, self.strips, self.count, dt, width, height, wrap,
+                  self.obstacles, settings)
+                 for strip in range(self.strips)]
+        with self.profiler.phase("steering"):
+            self._pool.map(_step_strip, tasks)
+        self._swap(width, height)
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self._closed = True
+        # Keep private copies so the flock stays usable after closing
+        self._buffers = [buffer.copy() for buffer in self._buffers]
+        self.state = self._buffers[self._front]
+        self._release(self._shm)
+        self._shm = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,109 @@
+"""
+Per-phase frame timers with rolling statistics and optional CSV output.
+"""
+
+import csv
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Deque, Dict, Sequence, Tuple
+import numpy as np
+from . import config
+
+# Phases timed by the simulation, in frame order
+PHASES: Tuple[str, ...] = ("neighbors", "analytics", "steering", "sprites", "draw", "flip")
+
+_DISABLED = nullcontext()
+
+
+class _PhaseTimer:
+    """Context manager adding the elapsed time of its block to one phase."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.current[self.name] += time.perf_counter() - self.start
+        return False
+
+
+class Profiler:
+    """
+    Lightweight per-phase timers.
+
+    ``with profiler.phase("neighbors"):`` times a block; when the profiler is disabled
+    it returns a shared no-op context, so instrumented code costs one attribute check.
+    Each call to ``end_frame`` moves the frame's timings into rolling windows and,
+    if a CSV file is open, appends them as one row.
+    """
+
+    def __init__(self, enabled: bool = False, phases: Sequence[str] = PHASES,
+                 window: int = config.PROFILE_WINDOW):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled (bool): Whether timers are active.
+            phases (Sequence[str]): Names of the phases that will be timed.
+            window (int): Number of frames kept for rolling statistics.
+        """
+        self.enabled = enabled
+        self.phases = tuple(phases)
+        self.frame = 0
+        self.current: Dict[str, float] = dict.fromkeys(self.phases, 0.0)
+        self.history: Dict[str, Deque[float]] = {name: deque(maxlen=window) for name in self.phases}
+        self._timers = {name: _PhaseTimer(self, name) for name in self.phases}
+        self._csv_file = None
+        self._csv_writer = None
+
+    def phase(self, name: str):
+        """Returns a context manager timing one phase of the current frame."""
+        if not self.enabled:
+            return _DISABLED
+        return self._timers[name]
+
+    def end_frame(self):
+        """Close the current frame, recording its timings."""
+        if not self.enabled:
+            return
+        for name in self.phases:
+            self.history[name].append(self.current[name] * 1000.0)
+        if self._csv_writer is not None:
+            self._csv_writer.writerow([self.frame] + [f"{self.current[name] * 1000.0:.4f}" for name in self.phases])
+        self.current = dict.fromkeys(self.phases, 0.0)
+        self.frame += 1
+
+    def mean_ms(self, name: str) -> float:
+        """Returns the mean milliseconds of a phase over the rolling window."""
+        values = self.history[name]
+        return sum(values) / len(values) if values else 0.0
+
+    def percentile_ms(self, name: str, q: float) -> float:
+        """Returns a percentile (0-100) of a phase's milliseconds over the rolling window."""
+        values = self.history[name]
+        return float(np.percentile(values, q)) if values else 0.0
+
+    def histogram(self, name: str, bins: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (counts, bin edges) of a phase's milliseconds over the rolling window."""
+        return np.histogram(np.fromiter(self.history[name], dtype=float), bins=bins)
+
+    def open_csv(self, path: str):
+        """Start appending per-frame timings to a CSV file."""
+        self.close_csv()
+        self._csv_file = open(path, "w", newline="")
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(["frame"] + [f"{name}_ms" for name in self.phases])
+
+    def close_csv(self):
+        """Flush and close the CSV file, if any."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = self._csv_writer = None
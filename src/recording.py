@@ -0,0 +1,183 @@
+"""
+Trajectory recording: streams every step's positions and headings to an append-only
+binary file, and reads it back through a memory map without loading it into RAM.
+
+File layout (little endian)::
+
+    b"BOIDREC" + version byte, uint32 header length, JSON header, padding to 8 bytes
+    then per recorded step:
+    uint64 tick, uint64 count, float32[3, count] (x, y, angle rows), uint8[count] colours,
+    padding to 8 bytes
+
+The JSON header holds the world size, step length, decimation and the config values
+that shape the trajectories.
+"""
+
+import json
+import queue
+import struct
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+from . import config
+from .flock import ANGLE, FlockEngine, FlockSnapshot
+
+MAGIC = b"BOIDREC"
+VERSION = 1
+# Config values stored in the header, enough to interpret (or re-run) the recording
+RECORDED_CONFIG = ("BOID_SIZE", "BOID_SPEED", "TURN_RATE", "MARGIN", "NEIGHBOR_COUNT",
+                   "WRAP_EDGES", "FIXED_DT", "SEED", "PALETTE")
+_FRAME_HEAD = struct.Struct("<QQ")
+
+
+def _padded(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+class TrajectoryRecorder:
+    """
+    Appends flock steps to a recording file from a background writer thread.
+
+    ``record`` only copies the active columns to float32 and queues them, so the step
+    loop never waits on the disk unless the writer falls ``queue_size`` steps behind.
+    """
+
+    def __init__(self, path: str, width: float, height: float, dt: Optional[float] = None,
+                 decimate: int = config.RECORD_EVERY, queue_size: int = config.RECORD_QUEUE):
+        """
+        Create the file, write its header and start the writer.
+
+        Args:
+            path (str): File to create, overwritten if it exists.
+            width (float): World width.
+            height (float): World height.
+            dt (Optional[float]): Simulated seconds per step, config.FIXED_DT if None.
+            decimate (int): Record every n-th tick only.
+            queue_size (int): Steps buffered in memory before ``record`` blocks.
+        """
+        self.path = path
+        self.decimate = max(decimate, 1)
+        self.frames = 0
+        header = {
+            "version": VERSION,
+            "width": width,
+            "height": height,
+            "dt": dt if dt is not None else config.FIXED_DT,
+            "decimate": self.decimate,
+            "config": {name: getattr(config, name) for name in RECORDED_CONFIG},
+        }
+        text = json.dumps(header).encode()
+        head = MAGIC + bytes([VERSION]) + struct.pack("<I", len(text)) + text
+        self._file = open(path, "wb")
+        self._file.write(head + bytes(_padded(len(head)) - len(head)))
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._write, name="trajectory-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, flock: FlockEngine):
+        """Queue the flock's current step if its tick is due."""
+        if flock.tick % self.decimate:
+            return
+        n = flock.count
+        # Rows X, Y and ANGLE are the first three of the state
+        xya = flock.state[:ANGLE + 1, :n].astype(np.float32)
+        self._queue.put((flock.tick, xya, flock.color.copy()))
+        self.frames += 1
+
+    def _write(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            tick, xya, color = item
+            n = len(color)
+            size = _FRAME_HEAD.size + xya.nbytes + n
+            self._file.write(_FRAME_HEAD.pack(tick, n))
+            self._file.write(xya.tobytes())
+            self._file.write(color.tobytes())
+            self._file.write(bytes(_padded(size) - size))
+
+    def close(self):
+        """Write out the queued steps and close the file."""
+        if self._file.closed:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class TrajectoryReader:
+    """
+    Random access to a recording through a read-only memory map.
+
+    Frames are views into the map, so only the pages of frames actually looked at
+    are read from disk. A truncated last frame (e.g. from a crashed run) is ignored.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map the file and index its frames.
+
+        Args:
+            path (str): Recording to open.
+        """
+        self.path = path
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        data = self._data
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"Not a trajectory recording: {path}")
+        version = int(data[len(MAGIC)])
+        if version != VERSION:
+            raise ValueError(f"Unsupported recording version {version} in {path}")
+        start = len(MAGIC) + 1
+        (length,) = struct.unpack("<I", bytes(data[start:start + 4]))
+        self.header: Dict = json.loads(bytes(data[start + 4:start + 4 + length]))
+        self.width: float = self.header["width"]
+        self.height: float = self.header["height"]
+        self.dt: float = self.header["dt"]
+
+        # Walk the frame headers once, the payloads are never touched here
+        self.offsets: List[int] = []
+        ticks: List[int] = []
+        offset = _padded(start + 4 + length)
+        while offset + _FRAME_HEAD.size <= len(data):
+            tick, n = _FRAME_HEAD.unpack(bytes(data[offset:offset + _FRAME_HEAD.size]))
+            size = _FRAME_HEAD.size + 13 * n
+            if offset + size > len(data):
+                break
+            self.offsets.append(offset)
+            ticks.append(tick)
+            offset += _padded(size)
+        self.ticks = np.array(ticks, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def frame(self, index: int) -> FlockSnapshot:
+        """
+        Returns one recorded step as a snapshot viewing the mapped file.
+
+        Args:
+            index (int): Frame number, negative counts from the end.
+
+        Returns:
+            FlockSnapshot: float32 positions and headings with the boid colours.
+        """
+        offset = self.offsets[index]
+        tick, n = _FRAME_HEAD.unpack(bytes(self._data[offset:offset + _FRAME_HEAD.size]))
+        start = offset + _FRAME_HEAD.size
+        xya = self._data[start:start + 12 * n].view(np.float32).reshape(3, n)
+        color = self._data[start + 12 * n:start + 13 * n]
+        return FlockSnapshot(xya[0], xya[1], xya[2], color, tick)
+
+    def close(self):
+        """Drop the memory map, it is unmapped once no frame views remain."""
+        self._data = None
@@ -0,0 +1,240 @@
+"""
+Flock renderers: one sprite per boid for small flocks, a NumPy pixel scatter for large ones
+and a density heatmap for huge ones.
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+import pygame as pg
+from typing import List, Optional
+from . import config
+from .boid import Boid
+from .flock import FlockEngine, FlockSnapshot
+
+
+class Renderer(ABC):
+    """
+    Draws a flock onto a surface.
+
+    ``update`` takes the (possibly interpolated) snapshot of the frame and ``draw``
+    renders it, so the simulation can time the two phases separately.
+    """
+
+    @abstractmethod
+    def update(self, snapshot: FlockSnapshot):
+        """Take the state to render next."""
+
+    @abstractmethod
+    def draw(self, screen: pg.Surface):
+        """Draw the last snapshot onto the screen."""
+
+
+class SpriteRenderer(Renderer):
+    """
+    One Boid sprite per flock slot, blitted from the shared rotation atlases.
+
+    Sprite i renders slot i; sprites are created or dropped as the flock count changes.
+    """
+
+    def __init__(self, flock: FlockEngine):
+        """
+        Initialize an empty sprite group.
+
+        Args:
+            flock (FlockEngine): The flock whose boids are drawn.
+        """
+        self.flock = flock
+        self.sprites: List[Boid] = []
+        self.group = pg.sprite.Group()
+
+    def _resize(self, count: int):
+        """Create sprites for new slots and drop those past the flock count."""
+        if count > len(self.sprites):
+            new = [Boid(i, self.flock) for i in range(len(self.sprites), count)]
+            self.sprites.extend(new)
+            self.group.add(new)
+        elif count < len(self.sprites):
+            self.group.remove(self.sprites[count:])
+            del self.sprites[count:]
+
+    def update(self, snapshot: FlockSnapshot):
+        self._resize(snapshot.count)
+        self.group.update(snapshot)
+
+    def draw(self, screen: pg.Surface):
+        self.group.draw(screen)
+
+
+class PixelRenderer(Renderer):
+    """
+    Rasterizes the whole flock at once into the screen's pixel buffer.
+
+    Each boid is a short line of ``length`` pixels in its palette colour, from its
+    position back along its heading, written with one NumPy scatter per frame.
+    Needs an 8, 16 or 32 bit surface (``pg.surfarray.pixels2d``).
+    """
+
+    def __init__(self, length: int = config.PIXEL_GLYPH_LENGTH):
+        """
+        Initialize the renderer.
+
+        Args:
+            length (int): Pixels per boid glyph, 1 draws single points.
+        """
+        self.offsets = np.arange(max(length, 1), dtype=float)
+        self.snapshot: Optional[FlockSnapshot] = None
+        # Palette mapped to the screen's pixel format, rebuilt if the format changes
+        self._format = None
+        self._palette = np.zeros(0, dtype=np.uint32)
+
+    def _mapped_palette(self, screen: pg.Surface) -> np.ndarray:
+        fmt = (screen.get_bitsize(), screen.get_masks())
+        if fmt != self._format:
+            self._palette = np.array([screen.map_rgb(c) for c in config.PALETTE], dtype=np.uint32)
+            self._format = fmt
+        return self._palette
+
+    def update(self, snapshot: FlockSnapshot):
+        self.snapshot = snapshot
+
+    def draw(self, screen: pg.Surface):
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.count == 0:
+            return
+        rad = np.deg2rad(snapshot.angle)
+        # (N, length) pixel coordinates, head first
+        px = np.rint(snapshot.x[:, None] - np.cos(rad)[:, None] * self.offsets).astype(np.intp)
+        py = np.rint(snapshot.y[:, None] - np.sin(rad)[:, None] * self.offsets).astype(np.intp)
+        colors = np.broadcast_to(self._mapped_palette(screen)[snapshot.color][:, None], px.shape)
+
+        w, h = screen.get_size()
+        inside = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+        pixels = pg.surfarray.pixels2d(screen)
+        try:
+            pixels[px[inside], py[inside]] = colors[inside]
+        finally:
+            # The view locks the surface until released
+            del pixels
+
+
+class HeatmapRenderer(Renderer):
+    """
+    Draws flock density instead of boids: a 2D histogram of positions over screen cells.
+
+    Cost is one ``np.bincount`` over the boids plus work proportional to the number
+    of cells, so it stays flat however many boids share a pixel.
+    """
+
+    def __init__(self, cell: int = config.HEATMAP_CELL):
+        """
+        Initialize the renderer.
+
+        Args:
+            cell (int): Cell size in screen pixels.
+        """
+        self.cell = max(cell, 1)
+        self.snapshot: Optional[FlockSnapshot] = None
+        # Colour of each density level, from the background to config.HEATMAP_COLOR
+        t = np.linspace(0.0, 1.0, 256)[:, None]
+        low, high = np.array(config.BACKGROUND_COLOR), np.array(config.HEATMAP_COLOR)
+        self.ramp = (low + (high - low) * t).astype(np.uint8)
+
+    def update(self, snapshot: FlockSnapshot):
+        self.snapshot = snapshot
+
+    def histogram(self, width: int, height: int) -> np.ndarray:
+        """Returns boid counts per cell, indexed [column, row] like pygame.surfarray."""
+        nx, ny = -(-width // self.cell), -(-height // self.cell)
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.count == 0:
+            return np.zeros((nx, ny), dtype=np.intp)
+        cx = (snapshot.x // self.cell).astype(np.intp)
+        cy = (snapshot.y // self.cell).astype(np.intp)
+        inside = (cx >= 0) & (cx < nx) & (cy >= 0) & (cy < ny)
+        return np.bincount(cx[inside] * ny + cy[inside], minlength=nx * ny).reshape(nx, ny)
+
+    def draw(self, screen: pg.Surface):
+        w, h = screen.get_size()
+        counts = self.histogram(w, h)
+        peak = counts.max()
+        if peak == 0:
+            return
+        # Log scale so sparse cells stay visible next to dense ones
+        level = (np.log1p(counts) * (255 / np.log1p(peak))).astype(np.intp)
+        cells = pg.surfarray.make_surface(self.ramp[level])
+        screen.blit(pg.transform.scale(cells, (counts.shape[0] * self.cell, counts.shape[1] * self.cell)), (0, 0))
+
+
+class LodRenderer(Renderer):
+    """
+    Picks the level of detail from the number of boids on screen and their density.
+
+    Up to ``sprite_limit`` visible boids are drawn as sprites, then as pixel glyphs,
+    and once there are more than ``heatmap_density`` boids per screen pixel as a
+    density heatmap. Zooming in spreads the flock over more pixels (and culls the
+    rest), so the level rises again.
+    """
+
+    LEVELS = ("sprites", "pixels", "heatmap")
+
+    def __init__(self, flock: Optional[FlockEngine], sprite_limit: int = config.SPRITE_RENDER_LIMIT,
+                 heatmap_density: float = config.HEATMAP_DENSITY):
+        """
+        Initialize every level.
+
+        Args:
+            flock (Optional[FlockEngine]): The flock to draw, None if sprite_limit is 0 (e.g. for replays).
+            sprite_limit (int): Most visible boids drawn with sprites.
+            heatmap_density (float): Visible boids per screen pixel above which the heatmap is drawn.
+        """
+        self.sprite_limit = sprite_limit
+        self.heatmap_density = heatmap_density
+        self.renderers = {
+            "sprites": SpriteRenderer(flock),
+            "pixels": PixelRenderer(),
+            "heatmap": HeatmapRenderer(),
+        }
+        self.level = "sprites"
+        self.snapshot: Optional[FlockSnapshot] = None
+
+    def select(self, count: int, width: int, height: int) -> str:
+        """Returns the level for a number of visible boids on a screen of the given size."""
+        if count <= self.sprite_limit:
+            return "sprites"
+        if count > self.heatmap_density * width * height:
+            return "heatmap"
+        return "pixels"
+
+    def update(self, snapshot: FlockSnapshot):
+        # The level needs the screen size, so it is picked when drawing
+        self.snapshot = snapshot
+
+    def draw(self, screen: pg.Surface):
+        if self.snapshot is None:
+            return
+        self.level = self.select(self.snapshot.count, *screen.get_size())
+        renderer = self.renderers[self.level]
+        renderer.update(self.snapshot)
+        renderer.draw(screen)
+
+
+def make_renderer(backend: str, flock: FlockEngine) -> Renderer:
+    """
+    Returns a renderer by name.
+
+    Args:
+        backend (str): "sprites", "pixels", "heatmap" or "auto" (level of detail by on-screen density).
+        flock (FlockEngine): The flock to draw.
+
+    Returns:
+        Renderer: The renderer.
+    """
+    if backend == "sprites":
+        return SpriteRenderer(flock)
+    if backend == "pixels":
+        return PixelRenderer()
+    if backend == "heatmap":
+        return HeatmapRenderer()
+    if backend == "auto":
+        return LodRenderer(flock)
+    raise ValueError(f"Unknown renderer: {backend}")
@@ -0,0 +1,99 @@
+"""
+Replay viewer: plays a trajectory recording at any speed without re-simulating.
+"""
+
+import pygame as pg
+import sys
+from . import config
+from .camera import Camera
+from .hud import PerformanceHud
+from .profiling import Profiler
+from .recording import TrajectoryReader
+from .render import LodRenderer
+
+class ReplayViewer:
+    """
+    Window showing the frames of a recording.
+
+    Frames are read straight from the memory-mapped file, so scrubbing anywhere in
+    a multi-GB recording only touches the pages of the frames shown.
+    Space pauses, Left/Right step one frame (ten with Shift), Up/Down double or
+    halve the speed, the mouse wheel zooms and Home resets the view.
+    """
+
+    def __init__(self, path: str, speed: float = config.REPLAY_SPEED):
+        """
+        Open the recording and a window of its world size.
+
+        Args:
+            path (str): Recording to play.
+            speed (float): Simulated seconds shown per real second.
+        """
+        self.reader = TrajectoryReader(path)
+        if len(self.reader) == 0:
+            raise ValueError(f"No frames in recording: {path}")
+        # Real seconds between recorded frames at speed 1
+        self.frame_time = self.reader.dt * self.reader.header["decimate"]
+        self.speed = speed
+        self.position = 0.0
+        self.paused = False
+
+        pg.init()
+        self.clock = pg.time.Clock()
+        self.size = (int(self.reader.width), int(self.reader.height))
+        self.screen = pg.display.set_mode(self.size)
+        pg.display.set_caption(f"{config.CAPTION} - replay")
+        self.camera = Camera()
+        # Replayed boids have no flock to back sprites, so the level of detail starts at pixels
+        self.renderer = LodRenderer(None, sprite_limit=0)
+        self.hud = PerformanceHud(Profiler(phases=()))
+        self.running = True
+
+    def seek(self, frames: float):
+        """Move the play position by a number of frames, clamped to the recording."""
+        self.position = min(max(self.position + frames, 0.0), len(self.reader) - 1)
+
+    def handle_input(self):
+        w, h = self.size
+        for event in pg.event.get():
+            if event.type == pg.QUIT:
+                self.running = False
+            elif event.type == pg.KEYDOWN:
+                step = 10 if event.mod & pg.KMOD_SHIFT else 1
+                if event.key == pg.K_ESCAPE:
+                    self.running = False
+                elif event.key == pg.K_SPACE:
+                    self.paused = not self.paused
+                elif event.key == pg.K_RIGHT:
+                    self.seek(step)
+                elif event.key == pg.K_LEFT:
+                    self.seek(-step)
+                elif event.key == pg.K_UP:
+                    self.speed *= 2
+                elif event.key == pg.K_DOWN:
+                    self.speed /= 2
+                elif event.key == pg.K_HOME:
+                    self.camera = Camera()
+            elif event.type == pg.MOUSEWHEEL:
+                self.camera.zoom_at(*pg.mouse.get_pos(), config.ZOOM_STEP ** event.y, w, h)
+
+    def draw(self):
+        frame_dt = self.clock.tick(config.FPS) / 1000.0
+        if not self.paused:
+            self.seek(frame_dt * self.speed / self.frame_time)
+        snapshot = self.reader.frame(int(self.position))
+        self.renderer.update(self.camera.view(snapshot, *self.size))
+
+        self.screen.fill(config.BACKGROUND_COLOR)
+        self.renderer.draw(self.screen)
+        self.hud.draw(self.screen, self.clock.get_fps(), snapshot.count)
+        pg.display.flip()
+
+    def run(self):
+        """Main replay loop."""
+        while self.running:
+            self.handle_input()
+            self.draw()
+        self.reader.close()
+        pg.quit()
+        sys.exit()
@@ -1,27 +1,65 @@
 import pygame as pg
-import numpy as np
 import sys
+from contextlib import nullcontext
+from typing import Optional, Tuple
 from . import config
-from .boid import Boid
+from .analytics import FlockAnalytics
+from .checkpoint import load_checkpoint, save_checkpoint
+from .camera import Camera
+from .flock import FlockEngine
+from .hud import PerformanceHud
+from .obstacles import Circle, make_obstacle
+from .profiling import Profiler
+from .recording import TrajectoryRecorder
+from .render import make_renderer
+from .stepper import FlockStepper
 
 class Simulation:
     """
     Main class to handle the Boid simulation.
     """
 
-    def __init__(self):
+    def __init__(self, profiler: Optional[Profiler] = None):
+        """
+        Initialize pygame, the window and an empty flock.
+
+        Args:
+            profiler (Optional[Profiler]): Phase timers, created from config if not given.
+        """
         pg.init()
         self.clock = pg.time.Clock()
         self._init_screen()
         
         self.running = True
-        self.boids_group = pg.sprite.Group()
-        
-        # Shared data array for optimized neighbor usage
-        # [x, y, angle, extra_slot]
-        self.shared_data = np.zeros((config.MAX_BOIDS, 4), dtype=float)
         
-        self.num_boids = 0
+        # Structure-of-arrays state for the whole flock, stepped in one batch
+        self.flock = FlockEngine(config.INITIAL_CAPACITY, seed=config.SEED)
+        self.flock.set_obstacles([make_obstacle(spec) for spec in config.OBSTACLES])
+        self.renderer = make_renderer(config.RENDERER, self.flock)
+        self.camera = Camera()
+        # Real time not yet simulated, stepped in FIXED_DT increments
+        self.accumulator = 0.0
+
+        self.profiler = profiler if profiler is not None else Profiler(enabled=config.PROFILE)
+        self.flock.profiler = self.profiler
+        # Timers stay on if they were enabled before the HUD was first shown
+        self._profile_always = self.profiler.enabled
+        self.hud = PerformanceHud(self.profiler)
+        self.show_hud = False
+
+        if config.ANALYTICS_PATH:
+            self.flock.analytics = FlockAnalytics(config.ANALYTICS_EVERY)
+            self.flock.analytics.open_csv(config.ANALYTICS_PATH)
+        w, h = self.screen.get_size()
+        # Created by run, after resuming, so a checkpoint's step and config are recorded
+        self.recorder: Optional[TrajectoryRecorder] = None
+
+        # Optionally step on a background thread; the loop below then only renders its snapshots
+        self.stepper: Optional[FlockStepper] = None
+        if config.THREADED:
+            # The profiler is not thread-safe, the HUD shows the stepper's rate instead
+            self.flock.profiler = Profiler()
+            self.stepper = FlockStepper(self.flock, w, h)
 
     def _init_screen(self):
         if config.FULLSCREEN:
@@ -31,12 +69,50 @@ class Simulation:
             self.screen = pg.display.set_mode((config.WIDTH, config.HEIGHT), pg.RESIZABLE)
         pg.display.set_caption(config.CAPTION)
 
+    def _mutate(self):
+        """Context for changing the flock, excluding the stepping thread if there is one."""
+        return self.stepper.mutate() if self.stepper is not None else nullcontext(self.flock)
+
     def add_boid(self):
-        """Adds a new boid to the simulation if limits allow."""
-        if self.num_boids < config.MAX_BOIDS:
-            new_boid = Boid(self.num_boids, self.screen, self.shared_data)
-            self.boids_group.add(new_boid)
-            self.num_boids += 1
+        """Adds a new boid to the simulation."""
+        x = y = None
+        if pg.mouse.get_pressed()[0]:
+            x, y = self.camera.to_world(*pg.mouse.get_pos())
+        # Randomised to avoid stacking if mouse isn't pressed
+        w, h = self.screen.get_size()
+        with self._mutate() as flock:
+            flock.spawn(w, h, x, y)
+
+    def add_boids(self, n: int, region: Optional[Tuple[float, float, float, float]] = None,
+                  heading_distribution: str = "uniform"):
+        """
+        Adds n boids in one batch.
+
+        Args:
+            n (int): Number of boids.
+            region (Optional[Tuple[float, float, float, float]]): (x, y, w, h) spawn area, the whole window if None.
+            heading_distribution (str): "uniform", "aligned" or "radial", see FlockEngine.spawn_boids.
+        """
+        w, h = self.screen.get_size()
+        with self._mutate() as flock:
+            flock.spawn_boids(n, w, h, region, heading_distribution)
+
+    def remove_boid(self, index: int):
+        """Removes a boid; the last boid moves into its slot."""
+        with self._mutate() as flock:
+            flock.remove(index)
+
+    def save_checkpoint(self, path: Optional[str] = None):
+        """Write the full simulation state to a checkpoint file, config.CHECKPOINT_PATH by default."""
+        w, h = self.screen.get_size()
+        with self._mutate() as flock:
+            save_checkpoint(path or config.CHECKPOINT_PATH, flock, w, h)
+
+    def load_checkpoint(self, path: Optional[str] = None):
+        """Replace the flock and config with those of a checkpoint, config.CHECKPOINT_PATH by default."""
+        with self._mutate() as flock:
+            load_checkpoint(path or config.CHECKPOINT_PATH, flock)
+        self.accumulator = 0.0
 
     def handle_input(self):
         for event in pg.event.get():
@@ -45,30 +121,110 @@ class Simulation:
             elif event.type == pg.KEYDOWN:
                 if event.key == pg.K_ESCAPE:
                     self.running = False
+                elif event.key == pg.key.key_code(config.HUD_KEY):
+                    self.toggle_hud()
+                elif event.key == pg.K_HOME:
+                    self.camera = Camera()
+                elif event.key == pg.K_F5:
+                    self.save_checkpoint()
+                elif event.key == pg.K_F9:
+                    self.load_checkpoint()
+            elif event.type == pg.MOUSEWHEEL:
+                w, h = self.screen.get_size()
+                self.camera.zoom_at(*pg.mouse.get_pos(), config.ZOOM_STEP ** event.y, w, h)
 
-        # Generate boid on click
-        if pg.mouse.get_pressed()[0]:
+        # Generate boid on click, remove the closest one on right click
+        buttons = pg.mouse.get_pressed()
+        if buttons[0]:
             self.add_boid()
+        elif buttons[2] and self.flock.count > 0:
+            self.remove_boid(self.flock.nearest(*self.camera.to_world(*pg.mouse.get_pos())))
+
+    def toggle_hud(self):
+        """Show or hide the performance overlay, timing phases while it is shown."""
+        self.show_hud = not self.show_hud
+        self.profiler.enabled = self.show_hud or self._profile_always
 
     def update(self):
-        dt = self.clock.tick(config.FPS) / 1000.0
-        self.boids_group.update(dt, wrap=config.WRAP_EDGES)
+        """Step the flock in fixed increments to catch up with real time."""
+        frame_dt = self.clock.tick(config.FPS) / 1000.0
+        w, h = self.screen.get_size()
+        if self.stepper is not None:
+            self.stepper.resize(w, h)
+        else:
+            self.accumulator = min(self.accumulator + frame_dt, config.FIXED_DT * config.MAX_STEPS_PER_FRAME)
+            while self.accumulator >= config.FIXED_DT:
+                self.flock.step(config.FIXED_DT, w, h, wrap=config.WRAP_EDGES)
+                if self.recorder is not None:
+                    self.recorder.record(self.flock)
+                self.accumulator -= config.FIXED_DT
+
+        keys = pg.key.get_pressed()
+        pan = config.PAN_SPEED * frame_dt
+        dx = (keys[pg.K_RIGHT] - keys[pg.K_LEFT]) * pan
+        dy = (keys[pg.K_DOWN] - keys[pg.K_UP]) * pan
+        if dx or dy:
+            self.camera.pan(dx, dy, w, h)
+
+        # The renderer only mirrors the flock state, interpolated by the leftover time
+        # (or the stepper's latest published step) and culled to the camera's view
+        with self.profiler.phase("sprites"):
+            if self.stepper is not None:
+                snapshot = self.stepper.latest
+            else:
+                snapshot = self.flock.snapshot(self.accumulator / config.FIXED_DT)
+            self.renderer.update(self.camera.view(snapshot, w, h))
+
+    def draw_obstacles(self):
+        """Draw the flock's obstacles as seen through the camera."""
+        cam = self.camera
+        for obstacle in self.flock.obstacles:
+            x, y = (obstacle.x - cam.x) * cam.zoom, (obstacle.y - cam.y) * cam.zoom
+            if isinstance(obstacle, Circle):
+                pg.draw.circle(self.screen, config.OBSTACLE_COLOR, (x, y), obstacle.radius * cam.zoom)
+            else:
+                rect = pg.Rect(round(x), round(y), round(obstacle.width * cam.zoom), round(obstacle.height * cam.zoom))
+                pg.draw.rect(self.screen, config.OBSTACLE_COLOR, rect)
 
     def draw(self):
-        self.screen.fill(config.BACKGROUND_COLOR)
-        self.boids_group.draw(self.screen)
-        pg.display.flip()
+        with self.profiler.phase("draw"):
+            self.screen.fill(config.BACKGROUND_COLOR)
+            self.renderer.draw(self.screen)
+            # After the flock, the heatmap covers the whole screen
+            self.draw_obstacles()
+            if self.show_hud:
+                sim_rate = self.stepper.steps_per_sec if self.stepper is not None else None
+                self.hud.draw(self.screen, self.clock.get_fps(), self.flock.count, sim_rate)
+        with self.profiler.phase("flip"):
+            pg.display.flip()
+        self.profiler.end_frame()
 
     def run(self):
         """Main game loop."""
-        # Initial boid
-        self.add_boid()
+        if config.RESUME_PATH:
+            self.load_checkpoint(config.RESUME_PATH)
+        else:
+            self.add_boids(config.INITIAL_BOIDS, heading_distribution=config.INITIAL_HEADINGS)
+        if config.RECORD_PATH:
+            w, h = self.screen.get_size()
+            self.recorder = TrajectoryRecorder(config.RECORD_PATH, w, h, decimate=config.RECORD_EVERY)
+            if self.stepper is not None:
+                self.stepper.on_step = self.recorder.record
+        if self.stepper is not None:
+            self.stepper.start()
         
         while self.running:
             self.handle_input()
             self.update()
             self.draw()
         
+        if self.stepper is not None:
+            self.stepper.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.flock.analytics is not None:
+            self.flock.analytics.close_csv()
+        self.profiler.close_csv()
         pg.quit()
         sys.exit()
 
@@ -0,0 +1,328 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# Upper bound on candidate pairs materialized per query batch
+MAX_PAIRS = 1 << 18
+
+
+def select_nearest(owner: np.ndarray, cand: np.ndarray, d2: np.ndarray,
+                   n_queries: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keep the k closest candidates of each query from a flat list of pairs.
+
+    Args:
+        owner (np.ndarray): Query index of each pair.
+        cand (np.ndarray): Candidate point index of each pair.
+        d2 (np.ndarray): Squared distance of each pair.
+        n_queries (int): Number of queries.
+        k (int): Maximum neighbors per query.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (indices, distances) of shape (n_queries, k),
+        sorted by distance and padded with -1 / inf.
+    """
+    idx = np.full((n_queries, k), -1, dtype=np.intp)
+    dist = np.full((n_queries, k), np.inf)
+    if len(owner) == 0 or k <= 0:
+        return idx, dist
+
+    # Rank of each pair within its owner's run (pairs arrive grouped by owner)
+    order = np.argsort(owner, kind="stable")
+    owner, cand, d2 = owner[order], cand[order], d2[order]
+    counts = np.bincount(owner, minlength=n_queries)
+    first = np.cumsum(counts) - counts
+    rank = np.arange(len(owner)) - first[owner]
+
+    width = counts.max()
+    if width > k and n_queries * width <= 4 * len(owner):
+        # Scatter into a padded (Q, width) matrix and partition each row, O(P)
+        padded = np.full((n_queries, width), np.inf)
+        padded[owner, rank] = d2
+        slots = np.argpartition(padded, k - 1, axis=1)[:, :k]
+        slot_d2 = np.take_along_axis(padded, slots, axis=1)
+        sort = np.argsort(slot_d2, axis=1)
+        slots = np.take_along_axis(slots, sort, axis=1)
+        slot_d2 = np.take_along_axis(slot_d2, sort, axis=1)
+
+        found = np.isfinite(slot_d2)
+        pair = first[:, None] + slots
+        idx[found] = cand[pair[found]]
+        dist[found] = np.sqrt(slot_d2[found])
+        return idx, dist
+
+    # Few or very uneven candidates: sort the pairs themselves
+    order = np.lexsort((d2, owner))
+    owner, cand, d2 = owner[order], cand[order], d2[order]
+    keep = rank < k
+
+    idx[owner[keep], rank[keep]] = cand[keep]
+    dist[owner[keep], rank[keep]] = np.sqrt(d2[keep])
+    return idx, dist
+
+
+class CellList:
+    """
+    Uniform-grid neighbor index with cells at least one perception radius wide.
+
+    Points are bucketed by cell with a counting sort once per frame, so a radius
+    query only has to look at the 3x3 block of cells around each query point.
+    With ``periodic=True`` the grid wraps around and distances use the minimum image.
+    """
+
+    def __init__(self, cell_size: float, width: float, height: float, periodic: bool = False):
+        """
+        Initialize the grid.
+
+        Args:
+            cell_size (float): Minimum cell size, normally the perception radius.
+            width (float): World width.
+            height (float): World height.
+            periodic (bool): Whether the world wraps around its edges.
+        """
+        self.cell_size = cell_size
+        self.width = width
+        self.height = height
+        self.periodic = periodic
+
+        if periodic:
+            # Cells must be at least cell_size wide, so round the count down
+            self.nx = max(1, int(width // cell_size))
+            self.ny = max(1, int(height // cell_size))
+            self.cell_w = width / self.nx
+            self.cell_h = height / self.ny
+        else:
+            self.nx = max(1, int(np.ceil(width / cell_size)))
+            self.ny = max(1, int(np.ceil(height / cell_size)))
+            self.cell_w = self.cell_h = cell_size
+
+        # Cell ids fit in 16 bits for any reasonable world, which makes NumPy's
+        # stable argsort a radix (counting) sort.
+        n_cells = self.nx * self.ny
+        self._cell_dtype = np.uint16 if n_cells <= np.iinfo(np.uint16).max else np.int64
+        self._offsets = self._neighbor_offsets()
+
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.sorted_x = np.empty(0)
+        self.sorted_y = np.empty(0)
+        self.order = np.empty(0, dtype=np.intp)
+        self.starts = np.zeros(n_cells, dtype=np.intp)
+        self.counts = np.zeros(n_cells, dtype=np.intp)
+
+    def _neighbor_offsets(self) -> np.ndarray:
+        """Returns the unique (dx, dy) cell offsets to search around a cell."""
+        if self.periodic:
+            # On tiny periodic grids -1 and +1 may be the same cell
+            ox = np.unique(np.arange(-1, 2) % self.nx)
+            oy = np.unique(np.arange(-1, 2) % self.ny)
+        else:
+            ox = oy = np.arange(-1, 2)
+        gx, gy = np.meshgrid(ox, oy, indexing="ij")
+        return np.stack([gx.ravel(), gy.ravel()], axis=1)
+
+    def _cell_coords(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cx = np.floor(x / self.cell_w).astype(np.intp)
+        cy = np.floor(y / self.cell_h).astype(np.intp)
+        if self.periodic:
+            return cx % self.nx, cy % self.ny
+        # Points outside the world are clamped to the border cells, which keeps
+        # every pair closer than cell_size within one cell of each other.
+        return np.clip(cx, 0, self.nx - 1), np.clip(cy, 0, self.ny - 1)
+
+    def build(self, x: np.ndarray, y: np.ndarray):
+        """
+        Bucket points into cells.
+
+        Args:
+            x (np.ndarray): X positions.
+            y (np.ndarray): Y positions.
+        """
+        self.x = x
+        self.y = y
+        cx, cy = self._cell_coords(x, y)
+        cells = (cy * self.nx + cx).astype(self._cell_dtype)
+        self.order = np.argsort(cells, kind="stable")
+        # Positions in cell order, so each cell's points are contiguous
+        self.sorted_x = x[self.order]
+        self.sorted_y = y[self.order]
+        self.counts = np.bincount(cells, minlength=self.nx * self.ny)
+        self.starts = np.cumsum(self.counts) - self.counts
+
+    def _candidates(self, cx: np.ndarray, cy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (cell ids, counts) of the cells around each query, shape (Q, 9)."""
+        ncx = cx[:, None] + self._offsets[None, :, 0]
+        ncy = cy[:, None] + self._offsets[None, :, 1]
+        if self.periodic:
+            ncx %= self.nx
+            ncy %= self.ny
+            inside = np.ones(ncx.shape, dtype=bool)
+        else:
+            inside = (ncx >= 0) & (ncx < self.nx) & (ncy >= 0) & (ncy < self.ny)
+        cells = np.where(inside, ncy * self.nx + ncx, 0)
+        counts = np.where(inside, self.counts[cells], 0)
+        return cells, counts
+
+    def pairs(self, qx: np.ndarray, qy: np.ndarray, radius: float,
+              exclude: Optional[np.ndarray] = None
+              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find all (query, point) pairs closer than radius.
+
+        Args:
+            qx (np.ndarray): Query X positions.
+            qy (np.ndarray): Query Y positions.
+            radius (float): Search radius, at most the cell size.
+            exclude (Optional[np.ndarray]): Point index to skip for each query (usually itself).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Flat (owner, candidate, squared distance) arrays.
+        """
+        if radius > self.cell_size:
+            raise ValueError("Search radius exceeds cell size")
+        cx, cy = self._cell_coords(qx, qy)
+        cells, counts = self._candidates(cx, cy)
+        per_query = counts.sum(axis=1)
+
+        owners, cands, dists = [], [], []
+        radius_sq = radius * radius
+        # Split the queries so at most MAX_PAIRS candidates are materialized at once
+        bounds = np.searchsorted(np.cumsum(per_query), np.arange(MAX_PAIRS, per_query.sum(), MAX_PAIRS))
+        for q in np.split(np.arange(len(qx)), np.unique(bounds)):
+            if len(q) == 0:
+                continue
+            cnt = counts[q].ravel()
+            total = cnt.sum()
+            if total == 0:
+                continue
+            owner = np.repeat(np.repeat(q, self._offsets.shape[0]), cnt)
+            run_start = np.repeat(np.cumsum(cnt) - cnt, cnt)
+            slot = np.repeat(self.starts[cells[q].ravel()], cnt) + (np.arange(total) - run_start)
+            dx = self.sorted_x[slot] - qx[owner]
+            dy = self.sorted_y[slot] - qy[owner]
+            if self.periodic:
+                dx -= self.width * np.round(dx / self.width)
+                dy -= self.height * np.round(dy / self.height)
+            d2 = dx * dx + dy * dy
+
+            keep = d2 < radius_sq
+            owner, cand, d2 = owner[keep], self.order[slot[keep]], d2[keep]
+            if exclude is not None:
+                keep = cand != exclude[owner]
+                owner, cand, d2 = owner[keep], cand[keep], d2[keep]
+            owners.append(owner)
+            cands.append(cand)
+            dists.append(d2)
+
+        if not owners:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0)
+        return np.concatenate(owners), np.concatenate(cands), np.concatenate(dists)
+
+    def query(self, qx: np.ndarray, qy: np.ndarray, k: int, radius: float,
+              exclude: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest points within radius of each query.
+
+        Args:
+            qx (np.ndarray): Query X positions.
+            qy (np.ndarray): Query Y positions.
+            k (int): Maximum neighbors per query.
+            radius (float): Search radius, at most the cell size.
+            exclude (Optional[np.ndarray]): Point index to skip for each query (usually itself).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (indices, distances) of shape (Q, k),
+            sorted by distance and padded with -1 / inf.
+        """
+        owner, cand, d2 = self.pairs(qx, qy, radius, exclude)
+        return select_nearest(owner, cand, d2, len(qx), k)
+
+
+class VerletList:
+    """
+    Cached neighbor candidates reused across frames.
+
+    Candidate pairs are collected within ``radius + skin`` and kept until some point
+    has moved more than half the skin since the last build. Until then no pair
+    can have crossed into the perception radius unseen, so each frame only has to
+    re-measure the cached pairs.
+    """
+
+    def __init__(self, radius: float, skin: float, width: float, height: float, periodic: bool = False):
+        """
+        Initialize the list.
+
+        Args:
+            radius (float): Perception radius.
+            skin (float): Extra distance cached beyond the radius.
+            width (float): World width.
+            height (float): World height.
+            periodic (bool): Whether the world wraps around its edges.
+        """
+        self.radius = radius
+        self.skin = skin
+        self.width = width
+        self.height = height
+        self.periodic = periodic
+        self.cells = CellList(radius + skin, width, height, periodic=periodic)
+
+        self.rebuilds = 0
+        self.steps = 0
+        self.owner = np.empty(0, dtype=np.intp)
+        self.cand = np.empty(0, dtype=np.intp)
+        self.ref_x: Optional[np.ndarray] = None
+        self.ref_y: Optional[np.ndarray] = None
+
+    def invalidate(self):
+        """Force a rebuild on the next query, e.g. after boids were added or removed."""
+        self.ref_x = self.ref_y = None
+
+    def _delta(self, dx: np.ndarray, dy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self.periodic:
+            dx = dx - self.width * np.round(dx / self.width)
+            dy = dy - self.height * np.round(dy / self.height)
+        return dx, dy
+
+    def needs_rebuild(self, x: np.ndarray, y: np.ndarray) -> bool:
+        """Whether any point moved more than half the skin since the last build."""
+        if self.ref_x is None or len(self.ref_x) != len(x):
+            return True
+        dx, dy = self._delta(x - self.ref_x, y - self.ref_y)
+        limit = 0.5 * self.skin
+        return bool(np.max(dx * dx + dy * dy, initial=0.0) > limit * limit)
+
+    def build(self, x: np.ndarray, y: np.ndarray):
+        """
+        Rebuild the candidate pairs from scratch.
+
+        Args:
+            x (np.ndarray): X positions.
+            y (np.ndarray): Y positions.
+        """
+        self.cells.build(x, y)
+        self.owner, self.cand, _ = self.cells.pairs(x, y, self.radius + self.skin, exclude=np.arange(len(x)))
+        self.ref_x = x.copy()
+        self.ref_y = y.copy()
+        self.rebuilds += 1
+
+    def query(self, x: np.ndarray, y: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest neighbors within the radius of every point.
+
+        Args:
+            x (np.ndarray): X positions, same points as the last build.
+            y (np.ndarray): Y positions.
+            k (int): Maximum neighbors per point.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (indices, distances) of shape (N, k),
+            sorted by distance and padded with -1 / inf.
+        """
+        if self.needs_rebuild(x, y):
+            self.build(x, y)
+        self.steps += 1
+
+        dx, dy = self._delta(x[self.cand] - x[self.owner], y[self.cand] - y[self.owner])
+        d2 = dx * dx + dy * dy
+        keep = d2 < self.radius * self.radius
+        return select_nearest(self.owner[keep], self.cand[keep], d2[keep], len(x), k)
@@ -0,0 +1,99 @@
+"""
+Background stepping: advances the flock on a worker thread, decoupled from rendering.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+from . import config
+from .flock import FlockEngine, FlockSnapshot
+
+class FlockStepper:
+    """
+    Steps a flock on its own thread and publishes an immutable snapshot after every step.
+
+    The render loop only reads ``latest``, so a slow frame never stalls the physics.
+    NumPy releases the GIL inside its kernels, which lets stepping and drawing overlap.
+    Changes to the flock from other threads must go through ``mutate``.
+    """
+
+    def __init__(self, flock: FlockEngine, width: float, height: float,
+                 dt: Optional[float] = None, rate: Optional[float] = None,
+                 on_step: Optional[Callable[[FlockEngine], None]] = None):
+        """
+        Initialize the stepper, call ``start`` to begin stepping.
+
+        Args:
+            flock (FlockEngine): The flock to step.
+            width (float): World width.
+            height (float): World height.
+            dt (Optional[float]): Simulated seconds per step, config.FIXED_DT (read every step,
+                so a loaded checkpoint's value applies) if None.
+            rate (Optional[float]): Steps per wall-clock second, 0 steps as fast as possible;
+                config.SIM_RATE if None, or real time (1 / config.FIXED_DT) if that is None too.
+            on_step (Optional[Callable[[FlockEngine], None]]): Called on the stepping thread after every step.
+        """
+        self.flock = flock
+        self.width = width
+        self.height = height
+        self.dt = dt
+        if rate is None:
+            rate = config.SIM_RATE if config.SIM_RATE is not None else 1.0 / config.FIXED_DT
+        self.rate = rate
+        self.on_step = on_step
+        self.steps = 0
+        self.lock = threading.Lock()
+        self.latest: FlockSnapshot = flock.snapshot()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="flock-stepper", daemon=True)
+        # Completed steps per second, measured over roughly the last second
+        self.steps_per_sec = 0.0
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Stop stepping and wait for the current step to finish."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def resize(self, width: float, height: float):
+        """Change the world size used from the next step on."""
+        self.width, self.height = width, height
+
+    @contextmanager
+    def mutate(self) -> Iterator[FlockEngine]:
+        """Hold off stepping while the flock is changed, then publish the changed state."""
+        with self.lock:
+            yield self.flock
+            self.latest = self.flock.snapshot()
+
+    def _run(self):
+        period = 1.0 / self.rate if self.rate > 0 else 0.0
+        next_step = time.perf_counter()
+        window_start, window_steps = next_step, 0
+        while not self._stop.is_set():
+            with self.lock:
+                dt = self.dt if self.dt is not None else config.FIXED_DT
+                self.flock.step(dt, self.width, self.height, wrap=config.WRAP_EDGES)
+                if self.on_step is not None:
+                    self.on_step(self.flock)
+                # Replacing the reference is atomic, readers see the old or the new snapshot
+                self.latest = self.flock.snapshot()
+            self.steps += 1
+            window_steps += 1
+
+            now = time.perf_counter()
+            if now - window_start >= 1.0:
+                self.steps_per_sec = window_steps / (now - window_start)
+                window_start, window_steps = now, 0
+            if period:
+                # Drop simulated time rather than fall further behind, as the fixed-step loop does
+                next_step = max(next_step + period, now - period * config.MAX_STEPS_PER_FRAME)
+                if next_step > now:
+                    self._stop.wait(next_step - now)
+            else:
+                # Give a thread waiting in mutate a chance at the lock
+                time.sleep(0)
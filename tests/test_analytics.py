@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src import config
+from src.analytics import FlockAnalytics, connected_components
+from src.flock import FlockEngine
+
+class TestAnalytics(unittest.TestCase):
+    def test_connected_components(self):
+        # Chains 0-1-2 (joined only through 2 -> 1) and 3-4, boid 5 alone
+        nbr_idx = np.array([[1, -1], [-1, -1], [1, -1], [4, -1], [-1, -1], [-1, -1]])
+        labels = connected_components(6, nbr_idx)
+        np.testing.assert_array_equal(labels, [0, 0, 0, 3, 3, 5])
+
+    def test_samples_from_step(self):
+        flock = FlockEngine(8)
+        flock.analytics = FlockAnalytics(interval=2, window=3)
+        # Two aligned boids close together, one far away in the edge margin
+        flock.add_boids(np.array([100.0, 110.0, 5.0]), np.array([100.0, 100.0, 300.0]), np.zeros(3))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.csv")
+            flock.analytics.open_csv(path)
+            for _ in range(8):
+                flock.step(config.FIXED_DT, 400, 400)
+            flock.analytics.close_csv()
+            with open(path) as f:
+                rows = f.read().splitlines()
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(len(flock.analytics.samples), 3)
+        first = flock.analytics.samples[0]
+        self.assertEqual(first["tick"], 2)
+        latest = flock.analytics.latest
+        self.assertEqual((latest["clusters"], latest["largest_cluster"]), (2, 2))
+        self.assertEqual((latest["clusters_1"], latest["clusters_2"]), (1, 1))
+        self.assertAlmostEqual(latest["edge_fraction"], 1 / 3)
+        self.assertEqual(flock.analytics.nn_counts.sum(), 2 * 4)
+
+if __name__ == '__main__':
+    unittest.main()
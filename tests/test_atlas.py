@@ -0,0 +1,33 @@
+import os
+import unittest
+import pygame as pg
+from src import config
+from src.atlas import RotationAtlas, clear_cache, get_atlas
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+class TestRotationAtlas(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        pg.display.set_mode((100, 100))
+        clear_cache()
+
+    def test_quantized_lookup(self):
+        atlas = RotationAtlas((255, 0, 0), steps=72)
+        self.assertEqual(len(atlas.frames), 72)
+        self.assertEqual(atlas.index(0.0), 0)
+        self.assertEqual(atlas.index(7.4), 1)
+        self.assertEqual(atlas.index(357.6), 0)
+        self.assertIs(atlas.get(90.0), atlas.frames[18])
+
+    def test_atlas_shared_per_colour(self):
+        self.assertIs(get_atlas(0), get_atlas(0))
+        self.assertIsNot(get_atlas(0), get_atlas(1))
+        self.assertEqual(get_atlas(1).color, config.PALETTE[1])
+
+    def tearDown(self):
+        clear_cache()
+        pg.quit()
+
+if __name__ == '__main__':
+    unittest.main()
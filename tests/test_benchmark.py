@@ -0,0 +1,20 @@
+import unittest
+from src.benchmark import compare, run_case
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_case_report(self):
+        result = run_case(50, wrap=True, steps=3, warmup=1)
+        self.assertEqual(result["boids"], 50)
+        self.assertGreater(result["steps_per_sec"], 0)
+        self.assertLessEqual(result["step_ms_p50"], result["step_ms_p99"])
+        self.assertEqual(set(result["phase_ms"]), {"neighbors", "steering", "render"})
+        self.assertGreater(result["peak_mem_bytes"], 0)
+
+    def test_compare_flags_slowdown(self):
+        baseline = {"results": [{"boids": 100, "wrap": False, "steps_per_sec": 100.0}]}
+        current = {"results": [{"boids": 100, "wrap": False, "steps_per_sec": 80.0}]}
+        self.assertEqual(len(compare(baseline, current, tolerance=0.1)), 1)
+        self.assertEqual(compare(baseline, current, tolerance=0.25), [])
+
+if __name__ == '__main__':
+    unittest.main()
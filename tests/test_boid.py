@@ -1,26 +1,34 @@
+import os
 import unittest
-import numpy as np
 import pygame as pg # Needed for vector math
+from src.atlas import clear_cache
 from src.boid import Boid
+from src.flock import FlockEngine
 from src import config
 
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
 class TestBoid(unittest.TestCase):
     def setUp(self):
         pg.init()
         # Mock screen
-        self.screen = pg.Surface((100, 100))
-        self.shared_data = np.zeros((10, 4), dtype=float)
+        self.screen = pg.display.set_mode((100, 100))
+        self.flock = FlockEngine(10)
 
     def test_boid_initialization(self):
-        boid = Boid(0, self.screen, self.shared_data)
+        self.flock.add_boid(30.0, 40.0, 90.0, color=2)
+        boid = Boid(0, self.flock)
         self.assertIsInstance(boid.pos, pg.Vector2)
         self.assertTrue(0 <= boid.angle <= 360)
         
-        # Check if shared data was updated
-        self.assertEqual(self.shared_data[0, 0], boid.pos.x)
-        self.assertEqual(self.shared_data[0, 1], boid.pos.y)
+        # Check if sprite mirrors the flock state
+        self.assertEqual(self.flock.x[0], boid.pos.x)
+        self.assertEqual(self.flock.y[0], boid.pos.y)
+        self.assertEqual(boid.rect.center, (30, 40))
+        self.assertEqual(boid.color, config.PALETTE[2])
 
     def tearDown(self):
+        clear_cache()
         pg.quit()
 
 if __name__ == '__main__':
@@ -0,0 +1,30 @@
+import unittest
+import numpy as np
+from src import config
+from src.camera import Camera
+from src.flock import FlockEngine
+
+class TestCamera(unittest.TestCase):
+    def test_zoom_keeps_point_under_cursor(self):
+        camera = Camera()
+        before = camera.to_world(300, 200)
+        camera.zoom_at(300, 200, 2.0, 800, 600)
+        self.assertEqual(camera.zoom, 2.0)
+        np.testing.assert_allclose(camera.to_world(300, 200), before)
+
+        camera.zoom_at(0, 0, 1e6, 800, 600)
+        self.assertEqual(camera.zoom, config.MAX_ZOOM)
+        camera.zoom_at(0, 0, 1e-6, 800, 600)
+        self.assertEqual((camera.x, camera.y, camera.zoom), (0.0, 0.0, 1.0))
+
+    def test_view_culls_and_projects(self):
+        flock = FlockEngine(4)
+        flock.add_boid(110.0, 120.0, 45.0, color=3)
+        flock.add_boid(700.0, 500.0, 0.0)
+        camera = Camera(100.0, 100.0, 2.0)
+        view = camera.view(flock.snapshot(), 400, 300)
+        self.assertEqual(view.count, 1)
+        self.assertEqual((view.x[0], view.y[0], view.angle[0], view.color[0]), (20.0, 40.0, 45.0, 3))
+
+if __name__ == '__main__':
+    unittest.main()
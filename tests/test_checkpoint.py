@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src import config
+from src.checkpoint import load_checkpoint, save_checkpoint
+from src.flock import FlockEngine
+from src.headless import HeadlessSimulation
+from src.parallel import ParallelFlockEngine
+
+class TestCheckpoint(unittest.TestCase):
+    def test_resume_is_bit_identical(self):
+        flock = FlockEngine(64, seed=3)
+        flock.spawn_boids(50, 400, 300)
+        for _ in range(5):
+            flock.step(config.FIXED_DT, 400, 300)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.npz")
+            save_checkpoint(path, flock, 400, 300)
+            restored, meta = load_checkpoint(path)
+        self.assertEqual((meta["tick"], meta["width"], meta["height"]), (5, 400, 300))
+        np.testing.assert_array_equal(restored.snapshot(0.5).x, flock.snapshot(0.5).x)
+
+        for f in (flock, restored):
+            f.spawn(400, 300)
+            for _ in range(5):
+                f.step(config.FIXED_DT, 400, 300)
+        self.assertEqual(restored.tick, flock.tick)
+        np.testing.assert_array_equal(restored.state[:, :restored.count], flock.state[:, :flock.count])
+        np.testing.assert_array_equal(restored.color, flock.color)
+
+    def test_resume_uses_saved_fixed_dt(self):
+        dt = config.FIXED_DT
+        try:
+            config.FIXED_DT = 0.01
+            sim = HeadlessSimulation(400, 300, num_boids=40, seed=5)
+            sim.run(5)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "state.npz")
+                sim.save_checkpoint(path)
+                sim.run(5)
+                config.FIXED_DT = dt
+                resumed = HeadlessSimulation(400, 300, num_boids=0)
+                resumed.load_checkpoint(path)
+            self.assertEqual(config.FIXED_DT, 0.01)
+            resumed.run(5)
+            self.assertEqual(resumed.flock.tick, sim.flock.tick)
+            np.testing.assert_array_equal(resumed.flock.state[:, :resumed.flock.count],
+                                          sim.flock.state[:, :sim.flock.count])
+        finally:
+            config.FIXED_DT = dt
+
+    def test_resume_into_parallel_flock(self):
+        size = config.BOID_SIZE
+        try:
+            config.BOID_SIZE = 10
+            flock = FlockEngine(64, seed=4)
+            flock.spawn_boids(60, 400, 300)
+            for _ in range(3):
+                flock.step(config.FIXED_DT, 400, 300)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "state.npz")
+                save_checkpoint(path, flock, 400, 300)
+                for _ in range(5):
+                    flock.step(config.FIXED_DT, 400, 300)
+                # Workers start with the default size, the checkpoint restores 10
+                config.BOID_SIZE = size
+                with ParallelFlockEngine(64, workers=2) as parallel:
+                    load_checkpoint(path, parallel)
+                    self.assertEqual(config.BOID_SIZE, 10)
+                    for _ in range(5):
+                        parallel.step(config.FIXED_DT, 400, 300)
+                    np.testing.assert_allclose(parallel.state[:, :parallel.count], flock.state[:, :flock.count])
+        finally:
+            config.BOID_SIZE = size
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+from src import config
+
+class TestConfig(unittest.TestCase):
+    def test_parse_value_matches_type(self):
+        self.assertEqual(config.parse_value("TURN_RATE", "120"), 120.0)
+        self.assertEqual(config.parse_value("FPS", "30"), 30)
+        self.assertIs(config.parse_value("WRAP_EDGES", "yes"), True)
+        self.assertEqual(config.parse_value("HEATMAP_COLOR", "(1, 2, 3)"), (1, 2, 3))
+        self.assertEqual(config.parse_value("SEED", "7"), 7)
+        self.assertIsNone(config.parse_value("SEED", "none"))
+        self.assertEqual(config.parse_value("RECORD_PATH", "run.bin"), "run.bin")
+        self.assertEqual(config.parse_value("RECORD_PATH", "123"), "123")
+        self.assertEqual(config.parse_value("SIM_RATE", "90"), 90.0)
+
+    def test_parse_value_rejects_bad_input(self):
+        for name, text in (("NO_SUCH_SETTING", "1"), ("ENV_PREFIX", "X_"), ("FPS", "fast"),
+                           ("WRAP_EDGES", "maybe"), ("PALETTE", "3"), ("SIM_RATE", "abc"),
+                           ("SEED", "1.5")):
+            with self.assertRaises(ValueError):
+                config.parse_value(name, text)
+
+    def test_environment_override(self):
+        code = "from src import config\nprint(config.TURN_RATE, config.WRAP_EDGES)\n"
+        env = dict(os.environ, BOIDS_TURN_RATE="120", BOIDS_WRAP_EDGES="true")
+        out = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                             capture_output=True, text=True).stdout
+        self.assertEqual(out.split(), ["120.0", "True"])
+
+    def test_environment_skips_unknown_names(self):
+        code = "from src import config\nprint(config.TURN_RATE)\n"
+        env = dict(os.environ, BOIDS_HOME="/x", BOIDS_TURN_RATE="120")
+        result = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                                capture_output=True, text=True)
+        self.assertEqual(result.stdout.split(), ["120.0"])
+        self.assertIn("BOIDS_HOME", result.stderr)
+
+    def test_cli_set_applies_before_defaults(self):
+        from src.__main__ import parse_args
+
+        width = config.WIDTH
+        try:
+            args = parse_args(["--set", "WIDTH=640"])
+            self.assertEqual(args.width, 640)
+        finally:
+            config.WIDTH = width
+
+    def test_library_does_not_import_pygame(self):
+        code = ("import sys\n"
+                "import src.flock, src.ensemble, src.analytics, src.checkpoint, src.recording, src.stepper\n"
+                "from src import FlockEngine\n"
+                "FlockEngine().spawn_boids(10, 200, 200)\n"
+                "assert 'pygame' not in sys.modules\n")
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+if __name__ == '__main__':
+    unittest.main()
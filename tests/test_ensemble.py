@@ -0,0 +1,41 @@
+import io
+import unittest
+import numpy as np
+from src import config
+from src.ensemble import Ensemble, parameter_grid, run_sweep, write_table
+from src.flock import ANGLE, X, Y, FlockEngine
+
+class TestEnsemble(unittest.TestCase):
+    def test_single_run_matches_flock_engine(self):
+        ensemble = Ensemble([{}], 150, 500, 400, seeds=[2])
+        flock = FlockEngine(150)
+        flock.add_boids(ensemble.state[X, 0], ensemble.state[Y, 0], ensemble.state[ANGLE, 0])
+        for _ in range(5):
+            ensemble.step(config.FIXED_DT)
+            flock.step(config.FIXED_DT, 500, 400)
+        np.testing.assert_allclose(ensemble.state[:, 0], flock.state[:, :150])
+
+    def test_runs_are_independent(self):
+        params = [{"TURN_RATE": 100.0, "BOID_SIZE": 25.0}, {"TURN_RATE": 300.0}]
+        both = Ensemble(params, 80, 300, 300, seeds=[5, 5])
+        alone = Ensemble(params[1:], 80, 300, 300, seeds=[5])
+        for _ in range(5):
+            both.step()
+            alone.step()
+        np.testing.assert_allclose(both.state[:, 1], alone.state[:, 0])
+        self.assertFalse(np.allclose(both.state[:, 0], both.state[:, 1]))
+        with self.assertRaises(ValueError):
+            Ensemble([{"FPS": 30}], 10, 100, 100)
+
+    def test_sweep_table(self):
+        grid = parameter_grid({"BOID_SIZE": [12, 20], "MARGIN": [30]}, repeats=2)
+        self.assertEqual(len(grid), 4)
+        rows = run_sweep(grid, num_boids=30, width=300, height=200, steps=3, chunk=3)
+        self.assertEqual([(r["BOID_SIZE"], r["repeat"]) for r in rows], [(12, 0), (12, 1), (20, 0), (20, 1)])
+        self.assertTrue(all(0 <= r["polarization"] <= 1 for r in rows))
+        out = io.StringIO()
+        write_table(rows, out)
+        self.assertEqual(len(out.getvalue().splitlines()), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import numpy as np
+from src import config
+from src.flock import FlockEngine, nearest_neighbors
+
+class TestFlockEngine(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_nearest_neighbors_matches_sort(self):
+        x = self.rng.uniform(0, 500, 200)
+        y = self.rng.uniform(0, 500, 200)
+        radius = 60.0
+        idx, dist = nearest_neighbors(x, y, 7, radius, block=64)
+
+        for i in range(len(x)):
+            d = np.hypot(x - x[i], y - y[i])
+            d[i] = np.inf
+            expected = np.sort(d[d < radius])[:7]
+            got = np.sort(dist[i][idx[i] >= 0])
+            np.testing.assert_allclose(got, expected)
+
+    def test_lone_boid_moves_straight(self):
+        flock = FlockEngine(4)
+        flock.add_boid(500.0, 400.0, 0.0)
+        flock.step(0.1, 1000, 800)
+        expected_speed = config.BOID_SPEED + config.NEIGHBOR_COUNT * 2
+        self.assertAlmostEqual(flock.x[0], 500.0 + expected_speed * 0.1)
+        self.assertAlmostEqual(flock.y[0], 400.0)
+        self.assertEqual(flock.angle[0], 0.0)
+
+    def test_edge_avoidance_turns_away(self):
+        flock = FlockEngine(4)
+        # Heading left, inside the left margin
+        flock.add_boid(config.MARGIN / 2, 400.0, 170.0)
+        flock.step(0.1, 1000, 800)
+        self.assertLess(flock.angle[0], 170.0)
+
+    def test_wrap_edges(self):
+        flock = FlockEngine(4)
+        flock.add_boid(999.0, 400.0, 0.0)
+        flock.step(0.1, 1000, 800, wrap=True)
+        self.assertEqual(flock.x[0], 0.0)
+
+    def test_storage_grows(self):
+        flock = FlockEngine(2)
+        for i in range(5):
+            flock.add_boid(float(i), 0.0, 0.0, color=i)
+        self.assertEqual(flock.count, 5)
+        self.assertGreaterEqual(flock.capacity, 5)
+        np.testing.assert_array_equal(flock.x, np.arange(5.0))
+        np.testing.assert_array_equal(flock.color, np.arange(5))
+
+    def test_remove_swaps_last(self):
+        flock = FlockEngine(8)
+        for i in range(4):
+            flock.add_boid(float(i), 0.0, 0.0, color=i)
+        self.assertEqual(flock.remove(1), 3)
+        np.testing.assert_array_equal(flock.x, [0.0, 3.0, 2.0])
+        np.testing.assert_array_equal(flock.color, [0, 3, 2])
+        self.assertEqual(flock.remove(2), -1)
+        self.assertEqual(flock.count, 2)
+        with self.assertRaises(IndexError):
+            flock.remove(2)
+
+    def test_removed_boids_are_not_neighbors(self):
+        flock = FlockEngine(8)
+        flock.add_boid(100.0, 100.0, 0.0)
+        flock.add_boid(110.0, 100.0, 90.0)
+        flock.remove(1)
+        flock.step(0.1, 1000, 800)
+        # Alone again, so no steering toward the removed boid
+        self.assertEqual(flock.angle[0], 0.0)
+
+    def test_spawn_boids_batch(self):
+        flock = FlockEngine(4, seed=0)
+        indices = flock.spawn_boids(1000, 600, 400, region=(100, 50, 200, 100))
+        np.testing.assert_array_equal(indices, np.arange(1000))
+        self.assertTrue(np.all((flock.x >= 100) & (flock.x <= 300)))
+        self.assertTrue(np.all((flock.y >= 50) & (flock.y <= 150)))
+        self.assertTrue(np.all(flock.speed == config.BOID_SPEED))
+        self.assertTrue(np.all(flock.color < len(config.PALETTE)))
+
+        flock.spawn_boids(10, 600, 400, region=(0, 0, 100, 100), heading_distribution="radial")
+        expected = np.rad2deg(np.arctan2(flock.y[1000:] - 50, flock.x[1000:] - 50)) % 360
+        np.testing.assert_allclose(flock.angle[1000:], expected)
+        with self.assertRaises(ValueError):
+            flock.spawn_boids(1, 600, 400, heading_distribution="spiral")
+
+    def make_seeded(self, seed):
+        flock = FlockEngine(200, seed=seed)
+        for _ in range(200):
+            flock.spawn(600, 400)
+        return flock
+
+    def test_seed_gives_identical_trajectories(self):
+        a, b = self.make_seeded(7), self.make_seeded(7)
+        for _ in range(10):
+            a.step(1 / 60, 600, 400)
+            b.step(1 / 60, 600, 400)
+        self.assertTrue(np.array_equal(a.state, b.state))
+        self.assertFalse(np.array_equal(a.state, self.make_seeded(8).state))
+
+    def test_step_independent_of_boid_order(self):
+        a = self.make_seeded(5)
+        b = FlockEngine(200)
+        order = self.rng.permutation(200)
+        for i in order:
+            b.add_boid(a.x[i], a.y[i], a.angle[i], a.speed[i])
+        a.step(1 / 60, 600, 400)
+        b.step(1 / 60, 600, 400)
+        np.testing.assert_allclose(b.state[:, :200], a.state[:, order])
+
+    def test_snapshot_interpolates(self):
+        flock = FlockEngine(4)
+        flock.add_boid(100.0, 100.0, 0.0)
+        flock.add_boid(999.0, 300.0, 0.0)
+        flock.step(0.1, 1000, 800, wrap=True)
+        half = flock.snapshot(0.5)
+        self.assertAlmostEqual(half.x[0], (100.0 + flock.x[0]) / 2)
+        # The wrapped boid is not dragged back across the world
+        self.assertEqual(half.x[1], flock.x[1])
+        self.assertEqual(half.tick, 1)
+        self.assertFalse(half.x.flags.writeable)
+
+if __name__ == '__main__':
+    unittest.main()
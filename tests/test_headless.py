@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import unittest
+from src.headless import HeadlessSimulation
+
+class TestHeadless(unittest.TestCase):
+    def test_run_fixed_ticks(self):
+        sim = HeadlessSimulation(400, 300, num_boids=50)
+        stats = sim.run(10)
+        self.assertEqual(sim.ticks, 10)
+        self.assertEqual(stats["boids"], 50)
+        self.assertGreater(stats["steps_per_sec"], 0)
+
+    def test_analytics_need_in_process_step(self):
+        with self.assertRaises(ValueError):
+            HeadlessSimulation(200, 200, num_boids=10, workers=2, analytics="metrics.csv")
+
+    def test_does_not_import_pygame(self):
+        code = ("import sys\n"
+                "from src.headless import HeadlessSimulation\n"
+                "HeadlessSimulation(200, 200, num_boids=10).run(2)\n"
+                "assert 'pygame' not in sys.modules\n")
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from src import config
+from src.flock import FlockEngine
+from src.obstacles import Circle, DistanceField, Rect, build_field, make_obstacle, parse_obstacle
+
+class TestObstacles(unittest.TestCase):
+    def test_signed_distances(self):
+        circle = Circle(50.0, 50.0, 10.0)
+        np.testing.assert_allclose(circle.distance(np.array([50.0, 70.0]), np.array([50.0, 50.0])), [-10.0, 10.0])
+        rect = Rect(0.0, 0.0, 20.0, 10.0)
+        np.testing.assert_allclose(rect.distance(np.array([10.0, 23.0, 23.0]), np.array([5.0, 5.0, 14.0])),
+                                   [-5.0, 3.0, 5.0])
+        self.assertEqual(make_obstacle(parse_obstacle("circle:1,2,3")), Circle(1.0, 2.0, 3.0))
+        with self.assertRaises(ValueError):
+            make_obstacle(("rect", 1, 2))
+
+    def test_field_lookup(self):
+        field = DistanceField(200, 100, [Circle(100.0, 50.0, 10.0)], cell=2.0)
+        distance, gx, gy = field.lookup(np.array([121.0, 1.0]), np.array([51.0, 51.0]))
+        # Next to the rock, the gradient points away from it
+        self.assertAlmostEqual(distance[0], 11.0, delta=1.5)
+        self.assertGreater(gx[0], 0.9)
+        # Next to the left border
+        self.assertAlmostEqual(distance[1], 1.0)
+        self.assertGreater(gx[1], 0.9)
+
+    def test_build_field_follows_field_cell(self):
+        rocks = [Circle(50.0, 50.0, 10.0)]
+        cell = config.FIELD_CELL
+        try:
+            config.FIELD_CELL = 16.0
+            field = build_field(rocks, 200, 100)
+            self.assertEqual(field.cell, 16.0)
+            self.assertIs(build_field(rocks, 200, 100, field=field), field)
+            config.FIELD_CELL = 8.0
+            self.assertEqual(build_field(rocks, 200, 100, field=field).cell, 8.0)
+        finally:
+            config.FIELD_CELL = cell
+
+    def test_boid_turns_away_from_rock(self):
+        edge_rate = config.EDGE_TURN_RATE
+        try:
+            config.EDGE_TURN_RATE = 400.0
+            flock = FlockEngine(4)
+            flock.set_obstacles([Circle(200.0, 200.0, 30.0)])
+            # Heading straight at the rock from the left, 10 px from its surface
+            flock.add_boid(160.0, 200.0, 0.0)
+            flock.step(config.FIXED_DT, 400, 400)
+        finally:
+            config.EDGE_TURN_RATE = edge_rate
+        turned = (flock.angle[0] + 180) % 360 - 180
+        rate = config.TURN_RATE + (1 - 10 / config.MARGIN) * (400.0 - config.TURN_RATE)
+        self.assertAlmostEqual(abs(turned), rate * config.FIXED_DT, delta=1.0)
+        self.assertIsNotNone(flock.field)
+
+    def test_wall_steering_ignores_distant_obstacles(self):
+        angles = []
+        for obstacles in ((), [Circle(900.0, 400.0, 30.0)]):
+            flock = FlockEngine(4)
+            flock.set_obstacles(obstacles)
+            # Heading left, inside the left margin
+            flock.add_boid(config.MARGIN / 2, 400.0, 170.0)
+            flock.step(config.FIXED_DT, 1000, 800)
+            angles.append(flock.angle[0])
+        self.assertEqual(angles[0], angles[1])
+
+if __name__ == '__main__':
+    unittest.main()
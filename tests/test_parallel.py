@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from src.flock import FlockEngine
+from src.parallel import ParallelFlockEngine
+
+class TestParallelFlockEngine(unittest.TestCase):
+    def assert_matches_serial(self, wrap):
+        rng = np.random.default_rng(3)
+        serial = FlockEngine(300)
+        with ParallelFlockEngine(300, workers=2, strips=3) as parallel:
+            for _ in range(300):
+                args = (rng.uniform(0, 900), rng.uniform(0, 600), rng.uniform(0, 360))
+                serial.add_boid(*args)
+                parallel.add_boid(*args)
+            for _ in range(5):
+                serial.step(1 / 60, 900, 600, wrap)
+                parallel.step(1 / 60, 900, 600, wrap)
+            np.testing.assert_allclose(parallel.state[:, :300], serial.state[:, :300])
+
+    def test_matches_serial(self):
+        self.assert_matches_serial(wrap=False)
+
+    def test_matches_serial_wrapped(self):
+        self.assert_matches_serial(wrap=True)
+
+    def test_growth_reattaches_workers(self):
+        serial = FlockEngine(2)
+        with ParallelFlockEngine(2, workers=1, strips=2) as parallel:
+            for flock in (serial, parallel):
+                flock.add_boid(100.0, 100.0, 0.0)
+                flock.step(1 / 60, 400, 300)
+                for i in range(20):
+                    flock.add_boid(50.0 + 10 * i, 120.0, 45.0)
+                flock.step(1 / 60, 400, 300)
+            np.testing.assert_allclose(parallel.state[:, :21], serial.state[:, :21])
+
+    def test_close_keeps_state(self):
+        parallel = ParallelFlockEngine(4, workers=1)
+        parallel.add_boid(10.0, 20.0, 0.0)
+        parallel.step(1 / 60, 100, 100)
+        x = parallel.x[0]
+        parallel.close()
+        self.assertEqual(parallel.x[0], x)
+
+if __name__ == '__main__':
+    unittest.main()
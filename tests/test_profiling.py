@@ -0,0 +1,44 @@
+import os
+import tempfile
+import time
+import unittest
+from src.profiling import Profiler
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled_is_noop(self):
+        profiler = Profiler(enabled=False)
+        self.assertIs(profiler.phase("neighbors"), profiler.phase("draw"))
+        with profiler.phase("neighbors"):
+            pass
+        profiler.end_frame()
+        self.assertEqual(len(profiler.history["neighbors"]), 0)
+
+    def test_rolling_window(self):
+        profiler = Profiler(enabled=True, phases=("a", "b"), window=3)
+        for _ in range(5):
+            with profiler.phase("a"):
+                time.sleep(0.001)
+            profiler.end_frame()
+        self.assertEqual(len(profiler.history["a"]), 3)
+        self.assertGreater(profiler.mean_ms("a"), 0.5)
+        self.assertEqual(profiler.mean_ms("b"), 0.0)
+        counts, _ = profiler.histogram("a", bins=4)
+        self.assertEqual(counts.sum(), 3)
+
+    def test_csv_dump(self):
+        profiler = Profiler(enabled=True, phases=("a",))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "frames.csv")
+            profiler.open_csv(path)
+            for _ in range(2):
+                with profiler.phase("a"):
+                    pass
+                profiler.end_frame()
+            profiler.close_csv()
+            with open(path) as f:
+                rows = f.read().splitlines()
+        self.assertEqual(rows[0], "frame,a_ms")
+        self.assertEqual(len(rows), 3)
+
+if __name__ == '__main__':
+    unittest.main()
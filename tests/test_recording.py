@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src import config
+from src.flock import FlockEngine
+from src.headless import HeadlessSimulation
+from src.recording import TrajectoryReader, TrajectoryRecorder
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "run.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_with_decimation(self):
+        flock = FlockEngine(16, seed=1)
+        flock.spawn_boids(10, 300, 200)
+        expected = []
+        with TrajectoryRecorder(self.path, 300, 200, dt=0.01, decimate=2) as recorder:
+            for _ in range(6):
+                flock.step(0.01, 300, 200)
+                recorder.record(flock)
+                if flock.tick % 2 == 0:
+                    expected.append(flock.snapshot())
+            flock.spawn_boids(5, 300, 200)
+
+        reader = TrajectoryReader(self.path)
+        self.assertEqual((reader.width, reader.height, reader.dt), (300, 200, 0.01))
+        self.assertEqual(reader.header["decimate"], 2)
+        np.testing.assert_array_equal(reader.ticks, [2, 4, 6])
+        for i, snapshot in enumerate(expected):
+            frame = reader.frame(i)
+            self.assertEqual(frame.tick, snapshot.tick)
+            np.testing.assert_array_equal(frame.x, snapshot.x.astype(np.float32))
+            np.testing.assert_array_equal(frame.angle, snapshot.angle.astype(np.float32))
+            np.testing.assert_array_equal(frame.color, snapshot.color)
+        reader.close()
+
+    def test_truncated_frame_ignored(self):
+        sim = HeadlessSimulation(200, 200, num_boids=20, record=self.path)
+        sim.run(3)
+        sim.close()
+        with open(self.path, "ab") as f:
+            f.write(np.array([4, 20], dtype="<u8").tobytes() + b"\0" * 10)
+        reader = TrajectoryReader(self.path)
+        self.assertEqual(len(reader), 3)
+        self.assertEqual(reader.frame(-1).count, 20)
+
+    def test_resumed_recording_uses_checkpoint_dt(self):
+        dt = config.FIXED_DT
+        checkpoint = os.path.join(self.tmp.name, "state.npz")
+        try:
+            config.FIXED_DT = 0.01
+            sim = HeadlessSimulation(200, 200, num_boids=10)
+            sim.run(2)
+            sim.save_checkpoint(checkpoint)
+            sim.close()
+            config.FIXED_DT = dt
+            resumed = HeadlessSimulation(200, 200, num_boids=0, record=self.path)
+            resumed.load_checkpoint(checkpoint)
+            resumed.run(2)
+            resumed.close()
+        finally:
+            config.FIXED_DT = dt
+        reader = TrajectoryReader(self.path)
+        self.assertEqual(reader.dt, 0.01)
+        self.assertEqual(reader.header["config"]["FIXED_DT"], 0.01)
+        reader.close()
+
+if __name__ == '__main__':
+    unittest.main()
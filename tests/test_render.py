@@ -0,0 +1,74 @@
+import os
+import unittest
+import pygame as pg
+from src import config
+from src.atlas import clear_cache
+from src.flock import FlockEngine
+from src.render import HeatmapRenderer, LodRenderer, PixelRenderer, Renderer, SpriteRenderer, make_renderer
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+class TestRenderers(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.screen = pg.display.set_mode((100, 100), depth=32)
+        self.flock = FlockEngine(10)
+        self.flock.add_boid(50.0, 50.0, 0.0, color=1)
+        self.flock.add_boid(-20.0, 10.0, 0.0, color=2)
+
+    def test_incomplete_backend_cannot_be_built(self):
+        class UpdateOnly(Renderer):
+            def update(self, snapshot):
+                pass
+
+        with self.assertRaises(TypeError):
+            UpdateOnly()
+
+    def test_pixel_renderer_scatters_glyphs(self):
+        renderer = PixelRenderer(length=3)
+        renderer.update(self.flock.snapshot())
+        self.screen.fill(config.BACKGROUND_COLOR)
+        renderer.draw(self.screen)
+        # Head at the boid, tail back along its heading (+x)
+        for x in (48, 49, 50):
+            self.assertEqual(tuple(self.screen.get_at((x, 50)))[:3], config.PALETTE[1])
+        self.assertEqual(tuple(self.screen.get_at((51, 50)))[:3], config.BACKGROUND_COLOR)
+
+    def test_sprite_renderer_follows_count(self):
+        renderer = SpriteRenderer(self.flock)
+        renderer.update(self.flock.snapshot())
+        self.assertEqual(len(renderer.group), 2)
+        self.flock.remove(0)
+        renderer.update(self.flock.snapshot())
+        self.assertEqual(len(renderer.group), 1)
+        renderer.draw(self.screen)
+
+    def test_lod_levels(self):
+        renderer = LodRenderer(self.flock, sprite_limit=10, heatmap_density=0.01)
+        self.assertEqual(renderer.select(10, 100, 100), "sprites")
+        self.assertEqual(renderer.select(100, 100, 100), "pixels")
+        self.assertEqual(renderer.select(101, 100, 100), "heatmap")
+        renderer.update(self.flock.snapshot())
+        renderer.draw(self.screen)
+        self.assertEqual(renderer.level, "sprites")
+        with self.assertRaises(ValueError):
+            make_renderer("vector", self.flock)
+
+    def test_heatmap_counts_per_cell(self):
+        self.flock.add_boid(52.0, 53.0, 0.0)
+        renderer = HeatmapRenderer(cell=10)
+        renderer.update(self.flock.snapshot())
+        counts = renderer.histogram(100, 100)
+        self.assertEqual(counts.shape, (10, 10))
+        # The boid left of the screen is not counted
+        self.assertEqual(counts.sum(), 2)
+        self.assertEqual(counts[5, 5], 2)
+        renderer.draw(self.screen)
+        self.assertEqual(tuple(self.screen.get_at((55, 55)))[:3], config.HEATMAP_COLOR)
+
+    def tearDown(self):
+        clear_cache()
+        pg.quit()
+
+if __name__ == '__main__':
+    unittest.main()
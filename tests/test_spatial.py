@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from src.flock import nearest_neighbors
+from src.spatial import CellList, VerletList
+
+class TestCellList(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+
+    def assert_matches_brute(self, x, y, width, height, periodic):
+        radius = 40.0
+        cells = CellList(radius, width, height, periodic=periodic)
+        cells.build(x, y)
+        idx, dist = cells.query(x, y, 7, radius, exclude=np.arange(len(x)))
+
+        period = (width, height) if periodic else None
+        ref_idx, ref_dist = nearest_neighbors(x, y, 7, radius, period)
+        np.testing.assert_allclose(dist, np.sort(ref_dist, axis=1))
+        # Returned neighbors are sorted by distance
+        finite = np.where(np.isfinite(dist), dist, 1e9)
+        self.assertTrue(np.all(np.diff(finite, axis=1) >= 0))
+        self.assertFalse(np.any(idx == np.arange(len(x))[:, None]))
+
+    def test_query_matches_brute_force(self):
+        # Include points slightly outside the world, they are clamped to border cells
+        x = self.rng.uniform(-30, 330, 400)
+        y = self.rng.uniform(-30, 230, 400)
+        self.assert_matches_brute(x, y, 300, 200, periodic=False)
+
+    def test_periodic_query_matches_brute_force(self):
+        x = self.rng.uniform(0, 300, 400)
+        y = self.rng.uniform(0, 200, 400)
+        self.assert_matches_brute(x, y, 300, 200, periodic=True)
+
+    def test_periodic_small_grid(self):
+        # Fewer than three cells per axis must not count neighbors twice
+        x = self.rng.uniform(0, 70, 50)
+        y = self.rng.uniform(0, 50, 50)
+        self.assert_matches_brute(x, y, 70, 50, periodic=True)
+
+    def test_neighbor_across_seam(self):
+        cells = CellList(40.0, 300, 200, periodic=True)
+        x = np.array([1.0, 299.0])
+        y = np.array([100.0, 100.0])
+        cells.build(x, y)
+        idx, dist = cells.query(x, y, 7, 40.0, exclude=np.arange(2))
+        self.assertEqual(idx[0, 0], 1)
+        self.assertAlmostEqual(dist[0, 0], 2.0)
+
+class TestVerletList(unittest.TestCase):
+    def test_matches_cell_list_while_moving(self):
+        rng = np.random.default_rng(2)
+        x = rng.uniform(0, 300, 300)
+        y = rng.uniform(0, 200, 300)
+        verlet = VerletList(40.0, 10.0, 300, 200, periodic=True)
+        cells = CellList(40.0, 300, 200, periodic=True)
+
+        for _ in range(20):
+            x = (x + rng.normal(0, 1.5, len(x))) % 300
+            y = (y + rng.normal(0, 1.5, len(y))) % 200
+            _, dist = verlet.query(x, y, 7)
+            cells.build(x, y)
+            _, ref_dist = cells.query(x, y, 7, 40.0, exclude=np.arange(len(x)))
+            np.testing.assert_allclose(dist, ref_dist)
+
+        # Lists are reused across most frames
+        self.assertGreater(verlet.rebuilds, 1)
+        self.assertLess(verlet.rebuilds, verlet.steps)
+
+    def test_rebuild_on_half_skin_displacement(self):
+        verlet = VerletList(40.0, 10.0, 300, 200)
+        x = np.array([10.0, 20.0])
+        y = np.array([10.0, 10.0])
+        verlet.query(x, y, 7)
+        verlet.query(x + 4.0, y, 7)
+        self.assertEqual(verlet.rebuilds, 1)
+        verlet.query(x + 6.0, y, 7)
+        self.assertEqual(verlet.rebuilds, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import time
+import unittest
+from src import config
+from src.flock import FlockEngine
+from src.stepper import FlockStepper
+
+class TestFlockStepper(unittest.TestCase):
+    def test_steps_in_background(self):
+        flock = FlockEngine(16, seed=0)
+        flock.spawn_boids(10, 200, 200)
+        stepper = FlockStepper(flock, 200, 200, rate=0)
+        stepper.start()
+        deadline = time.perf_counter() + 5.0
+        while stepper.steps < 5 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        with stepper.mutate() as locked:
+            locked.spawn_boids(3, 200, 200)
+            steps = stepper.steps
+        stepper.stop()
+        self.assertGreaterEqual(steps, 5)
+        self.assertEqual(stepper.latest.count, 13)
+        self.assertFalse(stepper.latest.x.flags.writeable)
+
+    def test_rate_limited(self):
+        flock = FlockEngine(4, seed=0)
+        flock.spawn_boids(2, 100, 100)
+        stepper = FlockStepper(flock, 100, 100, rate=20)
+        stepper.start()
+        time.sleep(0.3)
+        stepper.stop()
+        # About 6 steps at 20 per second, far fewer than an unthrottled loop
+        self.assertLess(stepper.steps, 20)
+        self.assertEqual(flock.tick, stepper.steps)
+
+    def test_default_rate_is_real_time(self):
+        dt = config.FIXED_DT
+        try:
+            config.FIXED_DT = 0.01
+            self.assertAlmostEqual(FlockStepper(FlockEngine(4), 100, 100).rate, 100.0)
+        finally:
+            config.FIXED_DT = dt
+
+if __name__ == '__main__':
+    unittest.main()